@@ -0,0 +1,5 @@
+import os
+
+# Importing tutor_agent builds the agent module, which requires an API key.
+# The tests never call the model, so any value will do.
+os.environ.setdefault("GOOGLE_API_KEY", "test")
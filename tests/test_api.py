@@ -0,0 +1,112 @@
+"""Tests for the chat API's streaming and request coalescing, run with a scripted agent."""
+
+import asyncio
+import time
+from typing import AsyncGenerator
+
+import orjson
+import pytest
+from google.adk import Runner
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from tutor_agent import api
+
+
+class ScriptedAgent(BaseAgent):
+    """Yields a fixed list of (delay, text, partial) steps; an Exception step is raised."""
+
+    script: list = []
+    runs: int = 0
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        self.runs += 1
+        for delay, step, partial in self.script:
+            await asyncio.sleep(delay)
+            if isinstance(step, Exception):
+                raise step
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                partial=partial,
+                content=types.Content(role="model", parts=[types.Part(text=step)]),
+            )
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = ScriptedAgent(name="tutor_agent")
+    session_service = InMemorySessionService()
+    runner = Runner(app_name="tutor_agent", agent=agent, session_service=session_service)
+    monkeypatch.setattr(api.app.state, "runner", runner, raising=False)
+    monkeypatch.setattr(api.app.state, "session_service", session_service, raising=False)
+    api._response_cache.clear()
+    return agent
+
+
+async def _stream(message: str = "What is velocity?"):
+    """Run stream_agent and return (seconds since start, event name, payload) per message."""
+    session = await api.get_or_create_session(None)
+    start = time.monotonic()
+    messages = []
+    async for raw in api.stream_agent(message, session):
+        event = "message"
+        for line in raw.strip().split("\n"):
+            if line.startswith("event: "):
+                event = line.removeprefix("event: ")
+            elif line.startswith("data: "):
+                data = orjson.loads(line.removeprefix("data: "))
+        messages.append((time.monotonic() - start, event, data))
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_aggregated_final_event(agent):
+    agent.script = [
+        (0, "Velocity ", True),
+        (0, "is speed ", True),
+        (0, "with direction.", True),
+        (0, "Velocity is speed with direction.", False),
+    ]
+    messages = await _stream()
+
+    text = "".join(data.get("text", "") for _, event, data in messages if event == "message")
+    assert text == "Velocity is speed with direction."
+    assert messages[-1][1] == "done"
+
+
+@pytest.mark.asyncio
+async def test_stream_flushes_buffered_text_during_a_pause(agent):
+    # After the first flush the batch size grows, so "a" is buffered on its own
+    agent.script = [(0, "x", True), (0, "a", True), (0.5, "b", True)]
+    messages = await _stream()
+
+    texts = [(at, data["text"]) for at, event, data in messages if event == "message"]
+    assert [text for _, text in texts] == ["x", "a", "b"]
+    assert texts[1][0] < 0.25
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_agent_errors(agent):
+    agent.script = [(0, "Velocity ", True), (0, RuntimeError("model unavailable"), True)]
+    messages = await _stream()
+
+    assert messages[0][2]["text"] == "Velocity "
+    assert messages[-1][1] == "error"
+    assert messages[-1][2] == {"detail": "Agent error: model unavailable"}
+
+
+@pytest.mark.asyncio
+async def test_identical_stateless_questions_share_one_run(agent):
+    agent.script = [(0.1, "Velocity is speed with direction.", False)]
+    replies = await asyncio.gather(
+        api.run_agent("What is velocity?"),
+        api.run_agent("What is velocity?"),
+    )
+
+    assert agent.runs == 1
+    assert [text for text, _ in replies] == ["Velocity is speed with direction."] * 2
+    # Each request still gets its own session
+    assert replies[0][1] != replies[1][1]
@@ -0,0 +1,121 @@
+"""Tests for the Redis session service, run against fakeredis."""
+
+import fakeredis.aioredis
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from tutor_agent.redis_services import RedisSessionService
+
+APP = "tutor_agent"
+USER = "student"
+
+
+@pytest.fixture
+def service():
+    return RedisSessionService(fakeredis.aioredis.FakeRedis())
+
+
+def _event(text: str, state_delta: dict | None = None) -> Event:
+    return Event(
+        author="user",
+        invocation_id="inv",
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta or {}),
+    )
+
+
+async def _get(service, session_id: str, **config):
+    return await service.get_session(
+        app_name=APP,
+        user_id=USER,
+        session_id=session_id,
+        config=GetSessionConfig(**config) if config else None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_session(service):
+    created = await service.create_session(
+        app_name=APP,
+        user_id=USER,
+        session_id="s1",
+        state={"topic": "algebra", "app:version": 2, "user:level": "beginner"},
+    )
+    loaded = await _get(service, "s1")
+
+    assert loaded.id == created.id == "s1"
+    assert loaded.last_update_time == created.last_update_time
+    assert loaded.events == []
+    assert loaded.state == {"topic": "algebra", "app:version": 2, "user:level": "beginner"}
+
+
+@pytest.mark.asyncio
+async def test_get_missing_session(service):
+    assert await _get(service, "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_append_event_stores_event_and_state_delta(service):
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    await service.append_event(session, _event("hi", {"topic": "algebra", "temp:scratch": 1}))
+    await service.append_event(session, _event("again", {"user:level": "advanced"}))
+
+    # Temp-scoped state is visible for the rest of the invocation, but not stored
+    assert session.state["temp:scratch"] == 1
+    loaded = await _get(service, "s1")
+    assert [e.content.parts[0].text for e in loaded.events] == ["hi", "again"]
+    assert loaded.state == {"topic": "algebra", "user:level": "advanced"}
+    assert "temp:scratch" not in loaded.events[0].actions.state_delta
+    assert loaded.last_update_time == session.last_update_time
+
+
+@pytest.mark.asyncio
+async def test_partial_events_are_not_stored(service):
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    event = _event("partial")
+    event.partial = True
+    await service.append_event(session, event)
+
+    assert session.events == []
+    assert (await _get(service, "s1")).events == []
+
+
+@pytest.mark.asyncio
+async def test_stale_append_is_rejected(service):
+    await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    first = await _get(service, "s1")
+    second = await _get(service, "s1")
+
+    await service.append_event(first, _event("from first", {"topic": "algebra"}))
+    with pytest.raises(ValueError, match="modified in storage"):
+        await service.append_event(second, _event("from second", {"topic": "physics"}))
+
+    # The rejected event is neither stored nor applied to the stale copy
+    assert second.events == []
+    assert "topic" not in second.state
+    loaded = await _get(service, "s1")
+    assert [e.content.parts[0].text for e in loaded.events] == ["from first"]
+    assert loaded.state == {"topic": "algebra"}
+
+
+@pytest.mark.asyncio
+async def test_append_to_deleted_session_is_rejected(service):
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    await service.delete_session(app_name=APP, user_id=USER, session_id="s1")
+
+    with pytest.raises(ValueError, match="not found"):
+        await service.append_event(session, _event("hi"))
+    assert session.events == []
+
+
+@pytest.mark.asyncio
+async def test_num_recent_events(service):
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    for i in range(5):
+        await service.append_event(session, _event(f"m{i}"))
+
+    loaded = await _get(service, "s1", num_recent_events=2)
+    assert [e.content.parts[0].text for e in loaded.events] == ["m3", "m4"]
+    assert len((await _get(service, "s1")).events) == 5
@@ -33,13 +33,18 @@ Example Educational Topics:
     - Physics: Mechanics, Thermodynamics, Electromagnetism
 """
 
+import functools
 import os
+import sys
+import textwrap
+from typing import Final
 from dotenv import load_dotenv
 from google.adk.agents import Agent
+from google.adk.tools.agent_tool import AgentTool
 
 from tutor_agent import prompt
-from tutor_agent.sub_agents.maths.agent import maths_agent
-from tutor_agent.sub_agents.physics.agent import physics_agent
+from tutor_agent.sub_agents.maths.agent import get_maths_agent
+from tutor_agent.sub_agents.physics.agent import get_physics_agent
 
 # Load environment variables
 load_dotenv()
@@ -52,19 +57,16 @@ if not api_key:
         "Please set it in your .env file to use the tutor agent."
     )
 
-# Initialize the root tutor agent
-root_agent = Agent(
-    model="gemini-2.0-flash-001",
-    name="tutor_agent",
-    description="""
+# Agent description, dedented and interned once at import
+_ROOT_AGENT_DESC: Final[str] = sys.intern(textwrap.dedent("""
     An educational AI tutor that focuses exclusively on academic learning assistance.
-    
+
     Primary Responsibilities:
     - Handle education-related questions only
     - Coordinate with specialized subject agents
     - Maintain learning context and progress
     - Ensure focused academic interactions
-    
+
     Subject Areas:
     - Mathematics (via Maths Agent)
         - Algebra, Calculus, Statistics
@@ -72,19 +74,54 @@ root_agent = Agent(
     - Physics (via Physics Agent)
         - Mechanics, Thermodynamics
         - Scientific concepts and formulas
-    
+
     The agent will:
     - Evaluate if questions are education-related
     - Delegate to appropriate subject specialists
     - Maintain learning progress
     - Focus solely on academic assistance
-    
+
     Note: The agent will politely redirect non-educational
     queries to focus on learning topics.
-    """,
-    instruction=prompt.ROOT_AGENT_INSTR,
-    sub_agents=[
-        maths_agent,  # Specialized agent for mathematical concepts
-        physics_agent  # Specialized agent for physics problems
-    ]
-)
+""").strip())
+
+
+# The memory agent, which records learning progress across turns, costs an
+# extra model call on most turns, so it is only attached when TUTOR_MEMORY is set
+TUTOR_MEMORY = os.getenv("TUTOR_MEMORY", "").lower() in ("1", "true", "yes")
+
+
+# The agent tree (root agent, sub-agents and their tools) is built on first
+# use rather than at import time. `root_agent` stays importable for the ADK
+# tooling through the module-level __getattr__ below.
+@functools.lru_cache(maxsize=1)
+def get_root_agent() -> Agent:
+    """Build the root tutor agent and its sub-agents on first use."""
+    instruction = prompt.ROOT_AGENT_INSTR
+    tools = []
+    before_agent_callback = None
+    if TUTOR_MEMORY:
+        from tutor_agent.tools.memory import _load_precreated_itinerary, get_memory_agent
+
+        instruction += prompt.ROOT_AGENT_MEMORY_INSTR
+        tools.append(AgentTool(agent=get_memory_agent()))
+        before_agent_callback = _load_precreated_itinerary
+
+    return Agent(
+        model="gemini-2.0-flash-001",
+        name="tutor_agent",
+        description=_ROOT_AGENT_DESC,
+        instruction=instruction,
+        sub_agents=[
+            get_maths_agent(),  # Specialized agent for mathematical concepts
+            get_physics_agent()  # Specialized agent for physics problems
+        ],
+        tools=tools,
+        before_agent_callback=before_agent_callback,
+    )
+
+
+def __getattr__(name):
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
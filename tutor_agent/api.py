@@ -20,6 +20,17 @@ API Endpoints:
                 "session_id": "session-id-for-continuation"
             }
 
+    POST /api/chat/stream
+        Same as /api/chat, but streams the tutor's reply as Server-Sent Events
+        while the model is generating it.
+        
+        Events:
+            data: {"text": "partial response text", "session_id": "session-id"}
+            event: error
+            data: {"detail": "Agent error: ..."}
+            event: done
+            data: {"session_id": "session-id"}
+
     GET /api/health
         Check the health status of the API service.
         
@@ -30,22 +41,135 @@ API Endpoints:
             }
 
 Error Responses:
-    400 Bad Request: Invalid input (e.g., empty message)
+    422 Unprocessable Entity: Invalid input (e.g., empty or overly long message)
     500 Internal Server Error: Agent or server error
     503 Service Unavailable: Session management error
+    504 Gateway Timeout: The agent did not finish within CHAT_TIMEOUT_S seconds
 """
 
-from fastapi import FastAPI, HTTPException, status
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from fastapi.requests import Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, AsyncIterator, List, Optional, Dict, Any
+import asyncio
+import os
+import re
+import secrets
+import sys
+import time
+from cachetools import TTLCache
+import orjson
+import xxhash
 from google.genai import types
 from google.adk import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 
-from tutor_agent.agent import root_agent
+from tutor_agent.agent import get_root_agent
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as agent_timeout
+else:
+    from async_timeout import timeout as agent_timeout
+
+# Longest accepted chat message, in characters
+MAX_MESSAGE_LENGTH = int(os.getenv("MAX_MESSAGE_LENGTH", "8192"))
+
+# Streaming batch settings: chunks are coalesced into batches that start at
+# STREAM_MIN_BATCH events and grow by STREAM_GROWTH_FACTOR per flush up to
+# STREAM_MAX_BATCH. A batch is also flushed once STREAM_FLUSH_MS has elapsed.
+STREAM_MIN_BATCH = int(os.getenv("STREAM_MIN_BATCH", "1"))
+STREAM_MAX_BATCH = int(os.getenv("STREAM_MAX_BATCH", "16"))
+STREAM_GROWTH_FACTOR = float(os.getenv("STREAM_GROWTH_FACTOR", "2"))
+STREAM_FLUSH_MS = float(os.getenv("STREAM_FLUSH_MS", "50"))
+
+# Cache of replies to stateless (session-less) questions, keyed by a hash of
+# the normalized message text. The hash is seeded per process so cache keys
+# cannot be precomputed to collide with another question's key.
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "4096"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "900"))
+_CACHE_KEY_SEED = secrets.randbits(64)
+_response_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
+# Stateless questions currently being answered, keyed like _response_cache
+_inflight: Dict[int, asyncio.Future] = {}
+
+# Optional gate in front of the agent, off unless EDU_GATE is set. When it is
+# on, new conversations whose message matches one of these clearly off-topic
+# requests get a canned redirect instead of an LLM call. Anything the patterns
+# do not positively match reaches the agent, as do messages in an existing
+# session.
+EDU_GATE = os.getenv("EDU_GATE", "").lower() in ("1", "true", "yes")
+_OFF_TOPIC_PATTERNS = (
+    r"\b(?:write|compose)\s+(?:me\s+)?an?\s+(?:poem|song|rap|haiku)\b",
+    r"\btell\s+me\s+a\s+joke\b",
+    r"\b(?:give|send|share)\s+me\s+an?\s+recipe\b",
+    r"\bweather\s+(?:forecast\s+)?(?:today|tomorrow|this\s+week)\b",
+    r"\b(?:stock|crypto(?:currency)?)\s+(?:tips?|picks?)\b",
+    r"\bwho\s+won\s+the\s+(?:game|match|election)\b",
+    r"\b(?:movie|film|tv\s+show)\s+recommendations?\b",
+    r"\bbook\s+(?:me\s+)?an?\s+(?:flight|hotel|table)\b",
+)
+_OFF_TOPIC_RE = re.compile("|".join(_OFF_TOPIC_PATTERNS), re.IGNORECASE)
+NON_EDUCATIONAL_REPLY = (
+    "I'm your tutor for mathematics and physics, so I can only help with "
+    "learning questions. Is there a maths or physics topic you'd like to explore?"
+)
+
+def is_educational(message: str) -> bool:
+    """Return False only when the gate is on and the message is clearly off-topic."""
+    return not EDU_GATE or _OFF_TOPIC_RE.search(message) is None
+
+# Sessions are kept in Redis when REDIS_URL is set, so that several workers
+# can share them. Otherwise they are kept in this process's memory.
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+SESSION_LOOKUP_TIMEOUT = float(os.getenv("SESSION_LOOKUP_TIMEOUT", "2"))
+
+# Upper bound on a single agent run, in seconds
+CHAT_TIMEOUT_S = float(os.getenv("CHAT_TIMEOUT_S", "30"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+    
+    Builds the session/memory services and a single Runner at startup and
+    shares them across all requests, so the agent graph is wired once instead
+    of on every chat call.
+    """
+    redis_pool = None
+    if REDIS_URL:
+        from redis.asyncio import ConnectionPool, Redis
+        from tutor_agent.redis_services import RedisMemoryService, RedisSessionService
+        
+        redis_pool = ConnectionPool.from_url(
+            REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS
+        )
+        redis_client = Redis(connection_pool=redis_pool)
+        app.state.session_service = RedisSessionService(redis_client)
+        app.state.memory_service = RedisMemoryService(redis_client)
+    else:
+        app.state.session_service = InMemorySessionService()
+        app.state.memory_service = InMemoryMemoryService()
+    
+    root_agent = get_root_agent()
+    app.state.runner = Runner(
+        app_name=root_agent.name,
+        agent=root_agent,
+        session_service=app.state.session_service,
+        memory_service=app.state.memory_service
+    )
+    yield
+    app.state.runner = None
+    if redis_pool is not None:
+        await redis_pool.disconnect()
 
 app = FastAPI(
     title="Tutor Agent API",
@@ -65,7 +189,9 @@ app = FastAPI(
     - Practice problems and solutions
     """,
     version="1.0.0",
-    prefix="/api"
+    prefix="/api",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -77,23 +203,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-session_service = InMemorySessionService()
-memory_service = InMemoryMemoryService()
-
 # Create API router
 from fastapi import APIRouter
-router = APIRouter(prefix="/api")
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
 
 class ChatRequest(BaseModel):
     """
     Request model for chat endpoint.
     
     Attributes:
-        message (str): The user's question or message to the tutor
+        message (str): The user's question or message to the tutor. Surrounding
+            whitespace is stripped; it must not be empty or longer than
+            MAX_MESSAGE_LENGTH characters.
         session_id (Optional[str]): Optional session ID for continuing a conversation
     """
-    message: str
+    message: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=MAX_MESSAGE_LENGTH)
+    ]
     session_id: Optional[str] = None
 
     class Config:
@@ -135,83 +262,183 @@ class ResponseError(AgentError):
     """Exception for response-related errors."""
     pass
 
-async def run_agent(message: str, session_id: Optional[str] = None) -> tuple[str, str]:
-    """Run the agent with the given message and return the response and session ID."""
+class AgentTimeoutError(AgentError):
+    """Exception for agent runs that exceed CHAT_TIMEOUT_S."""
+    pass
+
+@app.exception_handler(SessionError)
+async def session_error_handler(request: Request, exc: SessionError):
+    """Report session management failures as 503 Service Unavailable."""
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": f"Session error: {str(exc)}"}
+    )
+
+@app.exception_handler(ResponseError)
+async def response_error_handler(request: Request, exc: ResponseError):
+    """Report missing or invalid agent responses as 500 Internal Server Error."""
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"Response error: {str(exc)}"}
+    )
+
+@app.exception_handler(AgentTimeoutError)
+async def agent_timeout_handler(request: Request, exc: AgentTimeoutError):
+    """Report agent runs that took too long as 504 Gateway Timeout."""
+    return ORJSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": f"Agent error: {str(exc)}"}
+    )
+
+@app.exception_handler(AgentError)
+async def agent_error_handler(request: Request, exc: AgentError):
+    """Report agent execution failures as 500 Internal Server Error."""
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"Agent error: {str(exc)}"}
+    )
+
+@app.exception_handler(Exception)
+async def unexpected_error_handler(request: Request, exc: Exception):
+    """Report any other failure as 500 Internal Server Error."""
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"Unexpected error: {str(exc)}"}
+    )
+
+async def get_or_create_session(session_id: Optional[str] = None):
+    """
+    Return the session for the given ID, creating a new one if needed.
+    
+    A session ID that is not found is kept for the new session, so the
+    client's next request with the same ID finds it directly. The lookup is
+    bounded by SESSION_LOOKUP_TIMEOUT; a timeout is reported as a session
+    error rather than replacing a session that may still exist.
+    """
     try:
-        runner = Runner(
-            app_name=root_agent.name,
-            agent=root_agent,
-            session_service=session_service,
-            memory_service=memory_service
-        )
-        
-        # Create or get session
-        try:
-            if session_id:
-                session = await session_service.get_session(
-                    app_name=root_agent.name,
+        if session_id:
+            session = await asyncio.wait_for(
+                app.state.session_service.get_session(
+                    app_name=app.state.runner.app_name,
                     user_id="api_user",
                     session_id=session_id
-                )
-                if not session:
-                    session = await session_service.create_session(
-                        app_name=root_agent.name,
-                        user_id="api_user",
-                        state={}
-                    )
-            else:
-                session = await session_service.create_session(
-                    app_name=root_agent.name,
-                    user_id="api_user",
-                    state={}
-                )
-        except Exception as e:
-            raise SessionError(f"Failed to manage session: {str(e)}")
-        
-        # Create message content
-        content = types.Content(
-            role="user",
-            parts=[types.Part.from_text(text=message)]
+                ),
+                timeout=SESSION_LOOKUP_TIMEOUT
+            )
+            if session:
+                return session
+        return await app.state.session_service.create_session(
+            app_name=app.state.runner.app_name,
+            user_id="api_user",
+            state={},
+            session_id=session_id
         )
-        
-        # Run agent
-        last_event = None
-        try:
-            async for event in runner.run_async(
+    except asyncio.TimeoutError:
+        raise SessionError(f"Session lookup timed out after {SESSION_LOOKUP_TIMEOUT}s")
+    except Exception as e:
+        raise SessionError(f"Failed to manage session: {str(e)}")
+
+def _cache_key(message: str) -> int:
+    """Build the response cache key for a message (already stripped by ChatRequest)."""
+    return xxhash.xxh3_128_intdigest(message.lower(), seed=_CACHE_KEY_SEED)
+
+async def _record_exchange(session, message: str, response_text: str) -> None:
+    """
+    Append a question/answer pair that was not produced by the agent to a session.
+    
+    This keeps the returned session_id usable for follow-up questions even
+    though the agent was not run for this turn.
+    """
+    user_event = Event(
+        invocation_id=Event.new_id(),
+        author="user",
+        content=types.Content(role="user", parts=[types.Part.from_text(text=message)])
+    )
+    agent_event = Event(
+        invocation_id=user_event.invocation_id,
+        author=app.state.runner.agent.name,
+        content=types.Content(role="model", parts=[types.Part.from_text(text=response_text)])
+    )
+    try:
+        await app.state.session_service.append_event(session, user_event)
+        await app.state.session_service.append_event(session, agent_event)
+    except Exception as e:
+        raise SessionError(f"Failed to manage session: {str(e)}")
+
+async def _invoke_agent(session, message: str) -> str:
+    """Run the agent for one message in the given session and return its reply."""
+    content = types.Content(
+        role="user",
+        parts=[types.Part.from_text(text=message)]
+    )
+    
+    last_event = None
+    try:
+        async with agent_timeout(CHAT_TIMEOUT_S):
+            async for event in app.state.runner.run_async(
                 user_id=session.user_id,
                 session_id=session.id,
                 new_message=content
             ):
                 last_event = event
-        except Exception as e:
-            raise AgentError(f"Agent execution failed: {str(e)}")
-        
-        if not last_event or not last_event.content or not last_event.content.parts:
-            raise ResponseError("No valid response from agent")
-        
-        response_text = "\n".join([p.text for p in last_event.content.parts if p.text])
-        return response_text, session.id
-        
-    except SessionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Session error: {str(e)}"
-        )
-    except ResponseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Response error: {str(e)}"
-        )
-    except AgentError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Agent error: {str(e)}"
-        )
+    except asyncio.TimeoutError:
+        raise AgentTimeoutError(f"Agent timed out after {CHAT_TIMEOUT_S:g}s")
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}"
-        )
+        raise AgentError(f"Agent execution failed: {str(e)}")
+    
+    if not last_event or not last_event.content or not last_event.content.parts:
+        raise ResponseError("No valid response from agent")
+    
+    parts = last_event.content.parts
+    if len(parts) == 1:
+        return parts[0].text or ""
+    return "\n".join(p.text for p in parts if p.text)
+
+async def run_agent(message: str, session_id: Optional[str] = None) -> tuple[str, str]:
+    """
+    Run the agent with the given message and return the response and session ID.
+    
+    Stateless requests (no session_id) get a canned redirect when they are
+    clearly not educational, and are served from the response cache when the
+    same question has been answered recently. Identical stateless questions
+    that arrive while one is already being answered wait for that answer
+    instead of starting another agent run.
+    """
+    # Create or get session
+    session = await get_or_create_session(session_id)
+    
+    if session_id:
+        return await _invoke_agent(session, message), session.id
+    
+    cache_key = _cache_key(message)
+    if not is_educational(message):
+        reply_text = NON_EDUCATIONAL_REPLY
+    else:
+        reply_text = _response_cache.get(cache_key)
+        if reply_text is None and cache_key in _inflight:
+            reply_text = await asyncio.shield(_inflight[cache_key])
+    if reply_text is not None:
+        await _record_exchange(session, message, reply_text)
+        return reply_text, session.id
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        response_text = await _invoke_agent(session, message)
+    except BaseException as e:
+        error = e if isinstance(e, Exception) else AgentError("Agent execution was cancelled")
+        future.set_exception(error)
+        # Mark the exception as retrieved in case nobody was waiting
+        future.exception()
+        raise
+    else:
+        future.set_result(response_text)
+    finally:
+        del _inflight[cache_key]
+    
+    if response_text:
+        _response_cache[cache_key] = response_text
+    return response_text, session.id
 
 @router.post("/chat", 
     response_model=ChatResponse,
@@ -237,11 +464,17 @@ async def run_agent(message: str, session_id: Optional[str] = None) -> tuple[str
                 }
             }
         },
-        400: {
-            "description": "Invalid request (e.g., empty message)",
+        422: {
+            "description": "Invalid request (e.g., empty or overly long message)",
             "content": {
                 "application/json": {
-                    "example": {"detail": "Message cannot be empty"}
+                    "example": {
+                        "detail": [{
+                            "type": "string_too_short",
+                            "loc": ["body", "message"],
+                            "msg": "String should have at least 1 character"
+                        }]
+                    }
                 }
             }
         },
@@ -281,30 +514,212 @@ async def chat(request: ChatRequest):
         ChatResponse: The tutor's response and session information
     
     Raises:
-        HTTPException: Various HTTP errors with descriptive messages
+        AgentError: On session or agent failures, turned into HTTP errors
+            by the application's exception handlers
     """
-    if not request.message.strip():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Message cannot be empty"
-        )
+    response_text, session_id = await run_agent(
+        request.message,
+        request.session_id
+    )
+    return ChatResponse(
+        response=response_text,
+        session_id=session_id
+    )
+
+def _sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a payload as a single Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data).decode()}\n\n"
+
+async def stream_agent(message: str, session) -> AsyncIterator[str]:
+    """
+    Run the agent and yield its reply as SSE messages as soon as text arrives.
     
+    Partial events are forwarded as they are produced. The final aggregated
+    event ADK emits after a run of partials is skipped so text is not sent twice.
+    
+    Adjacent text chunks are coalesced before sending to keep per-message
+    framing overhead down. The first batch is small so the first token goes
+    out quickly; later batches grow towards STREAM_MAX_BATCH. Buffered text is
+    never held for more than STREAM_FLUSH_MS, even while the agent is busy in
+    a tool or sub-agent call and produces no text.
+    """
+    content = types.Content(
+        role="user",
+        parts=[types.Part.from_text(text=message)]
+    )
+    events = app.state.runner.run_async(
+        user_id=session.user_id,
+        session_id=session.id,
+        new_message=content,
+        run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+    )
+    # The ADK generator opens tracing spans that must be closed in the context
+    # they were opened in, so it is consumed by a single producer task rather
+    # than advanced from a new task per event. None marks the end of the run.
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    streamed_partial = False
+    buffer: list[str] = []
+    batch_size = STREAM_MIN_BATCH
+    flush_after = STREAM_FLUSH_MS / 1000
+    last_flush = time.monotonic()
     try:
-        response_text, session_id = await run_agent(
-            request.message,
-            request.session_id
-        )
-        return ChatResponse(
-            response=response_text,
-            session_id=session_id
-        )
-    except HTTPException:
-        raise
+        async with agent_timeout(CHAT_TIMEOUT_S):
+            while True:
+                # With text buffered, wait for the next event only until the
+                # buffer is due to be sent
+                wait_for = None
+                if buffer:
+                    wait_for = max(last_flush + flush_after - time.monotonic(), 0)
+                try:
+                    event = await asyncio.wait_for(queue.get(), wait_for)
+                except asyncio.TimeoutError:
+                    pass  # The buffered text is due; send it below
+                else:
+                    if event is None:
+                        break
+                    if isinstance(event, Exception):
+                        raise event
+                    if event.content and event.content.parts:
+                        if not event.partial and streamed_partial:
+                            streamed_partial = False
+                        else:
+                            text = "".join(p.text for p in event.content.parts if p.text)
+                            if text:
+                                streamed_partial = bool(event.partial)
+                                buffer.append(text)
+                    if len(buffer) < batch_size:
+                        continue
+                yield _sse({"text": "".join(buffer), "session_id": session.id})
+                buffer.clear()
+                last_flush = time.monotonic()
+                batch_size = min(
+                    STREAM_MAX_BATCH,
+                    max(batch_size + 1, int(batch_size * STREAM_GROWTH_FACTOR))
+                )
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}"
+        if buffer:
+            yield _sse({"text": "".join(buffer), "session_id": session.id})
+        if isinstance(e, asyncio.TimeoutError):
+            detail = f"Agent timed out after {CHAT_TIMEOUT_S:g}s"
+        else:
+            detail = str(e)
+        yield _sse({"detail": f"Agent error: {detail}"}, event="error")
+        return
+    finally:
+        producer.cancel()
+        await asyncio.wait({producer})
+        await events.aclose()
+    if buffer:
+        yield _sse({"text": "".join(buffer), "session_id": session.id})
+    yield _sse({"session_id": session.id}, event="done")
+
+@router.post("/chat/stream",
+    summary="Chat with the AI tutor (streaming)",
+    description="""
+    Send a message to the AI tutor and receive the response as a
+    Server-Sent Events stream while it is being generated.
+    
+    Each `data:` message carries a chunk of text and the session_id. The stream
+    ends with a `done` event, or an `error` event if the agent fails mid-stream.
+    """,
+    responses={
+        200: {
+            "description": "Streamed response from the tutor",
+            "content": {
+                "text/event-stream": {
+                    "example": 'data: {"text": "Let me help...", "session_id": "session-123"}'
+                }
+            }
+        },
+        422: {
+            "description": "Invalid request (e.g., empty or overly long message)",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [{
+                            "type": "string_too_short",
+                            "loc": ["body", "message"],
+                            "msg": "String should have at least 1 character"
+                        }]
+                    }
+                }
+            }
+        },
+        503: {
+            "description": "Service unavailable (e.g., session management error)",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Session error: Failed to manage session"}
+                }
+            }
+        }
+    }
+)
+async def chat_stream(request: ChatRequest):
+    """
+    Stream a chat response from the AI tutor agent.
+    
+    The session is resolved before the stream starts so session errors are
+    still reported with a regular HTTP status code.
+    
+    Args:
+        request (ChatRequest): The chat request containing the user's message
+            and optional session_id
+    
+    Returns:
+        StreamingResponse: A text/event-stream of the tutor's response
+    
+    Raises:
+        SessionError: If the session cannot be created, turned into a 503
+            by the application's exception handlers
+    """
+    redirect = request.session_id is None and not is_educational(request.message)
+    session = await get_or_create_session(request.session_id)
+    if redirect:
+        await _record_exchange(session, request.message, NON_EDUCATIONAL_REPLY)
+        return StreamingResponse(
+            iter([
+                _sse({"text": NON_EDUCATIONAL_REPLY, "session_id": session.id}),
+                _sse({"session_id": session.id}, event="done"),
+            ]),
+            media_type="text/event-stream"
         )
+    
+    return StreamingResponse(
+        stream_agent(request.message, session),
+        media_type="text/event-stream"
+    )
+
+HEALTH_CACHE_CONTROL = "public, max-age=1"
+
+_timestamp_second = -1
+_timestamp_text = ""
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as "YYYY-MM-DDTHH:MM:SSZ".
+    
+    The string only changes once per second, so it is formatted at most once
+    per second and reused for every health check in between.
+    """
+    global _timestamp_second, _timestamp_text
+    now = int(time.time())
+    if now != _timestamp_second:
+        _timestamp_text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _timestamp_second = now
+    return _timestamp_text
 
 @router.get("/health",
     summary="Check API health",
@@ -323,14 +738,19 @@ async def chat(request: ChatRequest):
         }
     }
 )
-async def health_check():
+async def health_check(response: Response):
     """
     Health check endpoint.
     
+    The response may be cached for one second (matching the timestamp
+    resolution), so frequent load balancer probes can be answered by a proxy.
+    The chat endpoints are not cacheable at the HTTP layer.
+    
     Returns:
         dict: Health status and current timestamp
     """
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    response.headers["Cache-Control"] = HEALTH_CACHE_CONTROL
+    return {"status": "healthy", "timestamp": _utc_timestamp()}
 
 # Include the router in the app
 app.include_router(router)
@@ -25,4 +25,10 @@ ROOT_AGENT_INSTR = """
 **Subject Integration:**
 - When problems involve both math and physics, start with `physics_agent` for conceptual understanding, then use `maths_agent` for calculations
 - Always explain the connections between different subjects and concepts
-"""
\ No newline at end of file
+"""
+
+# Appended to ROOT_AGENT_INSTR when the memory agent is enabled (TUTOR_MEMORY)
+ROOT_AGENT_MEMORY_INSTR = """
+**Learning History:**
+- Use the tool `memory_agent` to record the topics covered, the student's scores and their progress, and to recall them in later turns
+"""
@@ -0,0 +1,321 @@
+"""
+Redis Session and Memory Services
+
+Redis-backed implementations of the ADK session and memory services. They let
+several API workers share session state, so a conversation can continue no
+matter which worker handles the next request.
+
+Storage Layout:
+    adk:session:{app}:{user}:{session_id}         Hash of session metadata (last_update_time)
+    adk:session_state:{app}:{user}:{session_id}   Hash of session-scoped state
+    adk:session_events:{app}:{user}:{session_id}  List of event JSON, oldest first
+    adk:sessions:{app}:{user}                     Set of session IDs for the user
+    adk:app_state:{app}                           Hash of "app:" prefixed state
+    adk:user_state:{app}:{user}                   Hash of "user:" prefixed state
+    adk:memory:{app}:{user}                       Hash of session ID -> remembered events
+
+Appending an event pushes it onto the event list and writes only its state
+delta, so the cost of a turn does not grow with the length of the
+conversation. Each append checks that the session's last_update_time in
+Redis still matches the caller's copy, so a worker holding a stale session
+cannot overwrite events appended by another worker.
+
+Usage:
+    Both services share one connection pool, created once at API startup:
+
+        pool = ConnectionPool.from_url(REDIS_URL, max_connections=50)
+        client = Redis(connection_pool=pool)
+        session_service = RedisSessionService(client)
+        memory_service = RedisMemoryService(client)
+"""
+
+from datetime import datetime
+import re
+import time
+import uuid
+from typing import Any, Optional
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+from google.adk.events import Event
+from google.adk.memory.base_memory_service import BaseMemoryService, SearchMemoryResponse
+from google.adk.memory.memory_entry import MemoryEntry
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import (
+    BaseSessionService,
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.state import State
+
+
+def _session_key(app_name: str, user_id: str, session_id: str) -> str:
+    return f"adk:session:{app_name}:{user_id}:{session_id}"
+
+
+def _session_state_key(app_name: str, user_id: str, session_id: str) -> str:
+    return f"adk:session_state:{app_name}:{user_id}:{session_id}"
+
+
+def _session_events_key(app_name: str, user_id: str, session_id: str) -> str:
+    return f"adk:session_events:{app_name}:{user_id}:{session_id}"
+
+
+def _session_index_key(app_name: str, user_id: str) -> str:
+    return f"adk:sessions:{app_name}:{user_id}"
+
+
+def _app_state_key(app_name: str) -> str:
+    return f"adk:app_state:{app_name}"
+
+
+def _user_state_key(app_name: str, user_id: str) -> str:
+    return f"adk:user_state:{app_name}:{user_id}"
+
+
+def _memory_key(app_name: str, user_id: str) -> str:
+    return f"adk:memory:{app_name}:{user_id}"
+
+
+def _dump_json(value: Any) -> bytes:
+    """Encode a state value or event list as JSON, accepting non-string dict keys like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+_STALE_SESSION_ERROR = (
+    "The session has been modified in storage since it was loaded. "
+    "Please reload the session before appending events."
+)
+
+
+def _split_state(state: dict[str, Any]) -> tuple[dict, dict, dict]:
+    """Split a state dict into app-, user- and session-scoped parts."""
+    app_state, user_state, session_state = {}, {}, {}
+    for key, value in state.items():
+        if key.startswith(State.APP_PREFIX):
+            app_state[key.removeprefix(State.APP_PREFIX)] = value
+        elif key.startswith(State.USER_PREFIX):
+            user_state[key.removeprefix(State.USER_PREFIX)] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session_state[key] = value
+    return app_state, user_state, session_state
+
+
+class RedisSessionService(BaseSessionService):
+    """A session service that stores sessions in Redis."""
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    def _write_shared_state(self, pipe, app_name: str, user_id: str,
+                            app_state: dict, user_state: dict) -> None:
+        if app_state:
+            pipe.hset(_app_state_key(app_name),
+                      mapping={k: _dump_json(v) for k, v in app_state.items()})
+        if user_state:
+            pipe.hset(_user_state_key(app_name, user_id),
+                      mapping={k: _dump_json(v) for k, v in user_state.items()})
+
+    async def _merge_shared_state(self, session: Session) -> Session:
+        """Add the app- and user-scoped state to a loaded session."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(_app_state_key(session.app_name))
+        pipe.hgetall(_user_state_key(session.app_name, session.user_id))
+        app_state, user_state = await pipe.execute()
+        for key, value in app_state.items():
+            session.state[State.APP_PREFIX + key.decode()] = orjson.loads(value)
+        for key, value in user_state.items():
+            session.state[State.USER_PREFIX + key.decode()] = orjson.loads(value)
+        return session
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session_id = (
+            session_id.strip() if session_id and session_id.strip()
+            else str(uuid.uuid4())
+        )
+        app_state, user_state, session_state = _split_state(state or {})
+        session = Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=session_state,
+            last_update_time=time.time(),
+        )
+        state_key = _session_state_key(app_name, user_id, session_id)
+        pipe = self.client.pipeline(transaction=True)
+        self._write_shared_state(pipe, app_name, user_id, app_state, user_state)
+        pipe.delete(state_key, _session_events_key(app_name, user_id, session_id))
+        if session_state:
+            pipe.hset(state_key,
+                      mapping={k: _dump_json(v) for k, v in session_state.items()})
+        pipe.hset(_session_key(app_name, user_id, session_id),
+                  "last_update_time", repr(session.last_update_time))
+        pipe.sadd(_session_index_key(app_name, user_id), session_id)
+        await pipe.execute()
+        return await self._merge_shared_state(session)
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        first_event = 0
+        if config and config.num_recent_events:
+            first_event = -config.num_recent_events
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hget(_session_key(app_name, user_id, session_id), "last_update_time")
+        pipe.hgetall(_session_state_key(app_name, user_id, session_id))
+        pipe.lrange(_session_events_key(app_name, user_id, session_id), first_event, -1)
+        last_update_time, state, events = await pipe.execute()
+        if last_update_time is None:
+            return None
+        session = Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state={key.decode(): orjson.loads(value) for key, value in state.items()},
+            events=[Event.model_validate_json(raw) for raw in events],
+            last_update_time=float(last_update_time),
+        )
+        if config and config.after_timestamp:
+            session.events = [
+                e for e in session.events if e.timestamp >= config.after_timestamp
+            ]
+        return await self._merge_shared_state(session)
+
+    async def list_sessions(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
+        session_ids = [
+            sid.decode()
+            for sid in await self.client.smembers(_session_index_key(app_name, user_id))
+        ]
+        if not session_ids:
+            return ListSessionsResponse()
+        pipe = self.client.pipeline(transaction=False)
+        for sid in session_ids:
+            pipe.hget(_session_key(app_name, user_id, sid), "last_update_time")
+        sessions = [
+            Session(
+                app_name=app_name,
+                user_id=user_id,
+                id=sid,
+                last_update_time=float(last_update_time),
+            )
+            for sid, last_update_time in zip(session_ids, await pipe.execute())
+            if last_update_time is not None
+        ]
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(
+            _session_key(app_name, user_id, session_id),
+            _session_state_key(app_name, user_id, session_id),
+            _session_events_key(app_name, user_id, session_id),
+        )
+        pipe.srem(_session_index_key(app_name, user_id), session_id)
+        await pipe.execute()
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+        # The caller's session is only changed by super().append_event once the
+        # event is stored, so a rejected append leaves it as it was. The stored
+        # copy drops temp-scoped state, which is never persisted.
+        stored = event
+        if event.actions and event.actions.state_delta:
+            stored = self._trim_temp_delta_state(
+                event.model_copy(update={"actions": event.actions.model_copy()})
+            )
+
+        app_state, user_state, session_state = {}, {}, {}
+        if stored.actions and stored.actions.state_delta:
+            app_state, user_state, session_state = _split_state(
+                stored.actions.state_delta
+            )
+        meta_key = _session_key(session.app_name, session.user_id, session.id)
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                # Fail, rather than overwrite, if another worker appended an
+                # event since this copy of the session was loaded
+                await pipe.watch(meta_key)
+                stored_update_time = await pipe.hget(meta_key, "last_update_time")
+                if stored_update_time is None:
+                    raise ValueError(f"Session {session.id} not found.")
+                if float(stored_update_time) != session.last_update_time:
+                    raise ValueError(_STALE_SESSION_ERROR)
+                pipe.multi()
+                self._write_shared_state(
+                    pipe, session.app_name, session.user_id, app_state, user_state
+                )
+                if session_state:
+                    pipe.hset(
+                        _session_state_key(session.app_name, session.user_id, session.id),
+                        mapping={k: _dump_json(v) for k, v in session_state.items()},
+                    )
+                pipe.rpush(
+                    _session_events_key(session.app_name, session.user_id, session.id),
+                    stored.model_dump_json(),
+                )
+                pipe.hset(meta_key, "last_update_time", repr(event.timestamp))
+                await pipe.execute()
+        except WatchError:
+            raise ValueError(_STALE_SESSION_ERROR)
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+        return event
+
+
+class RedisMemoryService(BaseMemoryService):
+    """
+    A memory service that stores session events in Redis.
+
+    Search uses the same keyword matching as ADK's in-memory memory service,
+    so it is meant for development and small deployments.
+    """
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    async def add_session_to_memory(self, session: Session) -> None:
+        events = [
+            event.model_dump(mode="json", exclude_none=True)
+            for event in session.events
+            if event.content and event.content.parts
+        ]
+        await self.client.hset(
+            _memory_key(session.app_name, session.user_id),
+            session.id,
+            _dump_json(events),
+        )
+
+    async def search_memory(
+        self, *, app_name: str, user_id: str, query: str
+    ) -> SearchMemoryResponse:
+        words_in_query = set(query.lower().split())
+        response = SearchMemoryResponse()
+        stored = await self.client.hvals(_memory_key(app_name, user_id))
+        for raw in stored:
+            for data in orjson.loads(raw):
+                event = Event.model_validate(data)
+                text = " ".join(p.text for p in event.content.parts if p.text)
+                words_in_event = set(re.findall(r"[A-Za-z]+", text.lower()))
+                if words_in_event & words_in_query:
+                    response.memories.append(
+                        MemoryEntry(
+                            content=event.content,
+                            author=event.author,
+                            timestamp=datetime.fromtimestamp(event.timestamp).isoformat(),
+                        )
+                    )
+        return response
@@ -1,14 +1,43 @@
+import logging
+import os
+
 import uvicorn
-from tutor_agent.api import app
+from tutor_agent.api import REDIS_URL, app
+
+_log = logging.getLogger(__name__)
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "tutor_agent.api:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    ) 
+    if os.getenv("ENV") == "prod":
+        # Production: uvloop + httptools, several workers and no file watcher.
+        # Without REDIS_URL each worker keeps its own in-memory sessions, and
+        # a follow-up message landing on another worker would silently start
+        # an empty session under the same ID, so only one worker is run.
+        workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+        if workers > 1 and not REDIS_URL:
+            _log.warning(
+                "REDIS_URL is not set; running 1 worker instead of %d so that "
+                "sessions are not split between workers", workers
+            )
+            workers = 1
+        uvicorn.run(
+            "tutor_agent.api:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=workers,
+            reload=False,
+            log_level="warning"
+        )
+    else:
+        uvicorn.run(
+            "tutor_agent.api:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        ) 
 
 
-# python -m tutor_agent.server
\ No newline at end of file
+# python -m tutor_agent.server
+# ENV=prod python -m tutor_agent.server
@@ -24,27 +24,47 @@ Example Topics:
     - Matrix operations
 """
 
+import functools
+import sys
+import textwrap
+from typing import Final
+
 from google.adk.agents import Agent
 from tutor_agent.sub_agents.maths import prompt
-from tutor_agent.tools.calculator import calculation_agent
 
-# Initialize the mathematics tutor agent
-maths_agent = Agent(
-    model="gemini-2.0-flash",
-    name="maths_agent",
-    description="""
+
+# Agent description, dedented and interned once at import
+_MATHS_AGENT_DESC: Final[str] = sys.intern(textwrap.dedent("""
     A specialized mathematical agent that provides comprehensive tutoring in mathematics.
-    
+
     Features:
     - Step-by-step problem solving
     - Conceptual explanations
     - Practice problems
     - Real-world applications
     - Interactive learning
-    
+
     The agent uses a calculator tool for computations and maintains
     learning progress through the memory system.
-    """,
-    instruction=prompt.MATHS_AGENT_INSTR,
-    tools=[calculation_agent],  # For mathematical computations
-)
\ No newline at end of file
+""").strip())
+
+
+@functools.lru_cache(maxsize=1)
+def get_maths_agent() -> Agent:
+    """Build the mathematics tutor agent on first use."""
+    from tutor_agent.tools.calculator import calculation_agent
+
+    return Agent(
+        model="gemini-2.0-flash",
+        name="maths_agent",
+        description=_MATHS_AGENT_DESC,
+        instruction=prompt.MATHS_AGENT_INSTR,
+        tools=[calculation_agent],  # For mathematical computations
+    )
+
+
+def __getattr__(name):
+    # Keep `maths_agent` importable; it is built on first access
+    if name == "maths_agent":
+        return get_maths_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
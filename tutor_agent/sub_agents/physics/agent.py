@@ -36,39 +36,59 @@ Example Teaching Flow:
        Response: Step-by-step calculation with explanation
 """
 
+import functools
+import sys
+import textwrap
+from typing import Final
+
 from google.adk.agents import Agent
 from tutor_agent.sub_agents.physics import prompt
-from tutor_agent.tools.calculator import calculation_agent
 
-# Initialize the physics tutor agent
-physics_agent = Agent(
-    model="gemini-2.0-flash",
-    name="physics_agent",
-    description="""
+
+# Agent description, dedented and interned once at import
+_PHYSICS_AGENT_DESC: Final[str] = sys.intern(textwrap.dedent("""
     A specialized physics agent that provides comprehensive tutoring in physics.
-    
+
     Teaching Philosophy:
     - Prioritize conceptual understanding
     - Use real-world examples and analogies
     - Build intuitive knowledge
     - Perform calculations only when requested
-    
+
     Features:
     - Conceptual explanations
     - Real-world applications
     - Interactive learning
     - Step-by-step problem solving (on request)
     - Laboratory experiments
-    
+
     The agent will:
     1. First explain concepts clearly
     2. Use examples and analogies
     3. Only perform calculations when explicitly asked
     4. Always explain the reasoning behind calculations
-    
+
     Note: The agent focuses on building understanding
     before diving into calculations.
-    """,
-    instruction=prompt.PHYSICS_AGENT_INSTR,
-    tools=[calculation_agent],  # For physics calculations (only when requested)
-)
\ No newline at end of file
+""").strip())
+
+
+@functools.lru_cache(maxsize=1)
+def get_physics_agent() -> Agent:
+    """Build the physics tutor agent on first use."""
+    from tutor_agent.tools.calculator import calculation_agent
+
+    return Agent(
+        model="gemini-2.0-flash",
+        name="physics_agent",
+        description=_PHYSICS_AGENT_DESC,
+        instruction=prompt.PHYSICS_AGENT_INSTR,
+        tools=[calculation_agent],  # For physics calculations (only when requested)
+    )
+
+
+def __getattr__(name):
+    # Keep `physics_agent` importable; it is built on first access
+    if name == "physics_agent":
+        return get_physics_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -25,112 +25,176 @@ Example Calculations:
     - Unit Conversion: 1 km = 1000 m
 """
 
+from functools import lru_cache, reduce
+from itertools import islice
+import logging
+import math
+from operator import mul, sub, truediv
+from statistics import fmean
+from types import MappingProxyType
+from typing import Callable, Mapping, Sequence
+
 from google.adk.agents import Agent
 from google.adk.tools.agent_tool import AgentTool
 
+_log = logging.getLogger(__name__)
+
+# How many numbers to show when logging an argument list
+_LOG_PREVIEW_LEN = 8
+
+
+def _op_add(numbers: Sequence[float]):
+    return sum(numbers)
+
+
+def _op_subtract(numbers: Sequence[float]):
+    try:
+        return numbers[0] - math.fsum(islice(numbers, 1, None))
+    except (ValueError, OverflowError):
+        # fsum rejects inf - inf and overflowing partial sums; plain
+        # subtraction gives nan or an infinity for these instead
+        return reduce(sub, numbers)
+
+
+def _op_multiply(numbers: Sequence[float]):
+    return reduce(mul, numbers, 1.0)
+
+
+def _op_divide(numbers: Sequence[float]):
+    if len(numbers) < 2:
+        return "Error: Division requires at least 2 numbers"
+    # Check every divisor up front so the division itself has no branches
+    if 0.0 in islice(numbers, 1, None):
+        return "Error: Division by zero"
+    # Divide step by step rather than by the product of the divisors, which
+    # can overflow where the sequential quotient would not.
+    return reduce(truediv, islice(numbers, 1, None), numbers[0])
+
+
+def _op_power(numbers: Sequence[float]):
+    if len(numbers) != 2:
+        return "Error: Power operation requires exactly 2 numbers (base, exponent)"
+    try:
+        return math.pow(numbers[0], numbers[1])
+    except ValueError:
+        # e.g. a negative base with a fractional exponent, or zero to a negative power
+        return "Error: Power result is undefined for these numbers"
+    except OverflowError:
+        return "Error: Power result is too large"
+
+
+def _op_average(numbers: Sequence[float]):
+    try:
+        return fmean(numbers)
+    except (ValueError, OverflowError):
+        # fmean sums with fsum, which has the same failures as in _op_subtract
+        return sum(numbers) / len(numbers)
+
+
+def _op_max(numbers: Sequence[float]):
+    return max(numbers)
+
+
+def _op_min(numbers: Sequence[float]):
+    return min(numbers)
+
+
+# Operation name -> handler. Each handler validates its own argument count.
+_OPS: Mapping[str, Callable] = MappingProxyType({
+    'add': _op_add,
+    'subtract': _op_subtract,
+    'multiply': _op_multiply,
+    'divide': _op_divide,
+    'power': _op_power,
+    'average': _op_average,
+    'max': _op_max,
+    'min': _op_min,
+})
+
+# Operations whose result for a single number is that number
+_SINGLETON_IDENTITY_OPS = frozenset({'add', 'subtract', 'multiply', 'average', 'max', 'min'})
+
+
+@lru_cache(maxsize=1024)
+def _cal_cached(operation: str, numbers: tuple[float, ...]):
+    """Memoised handler call; the model often repeats a calculation to check it."""
+    return _OPS[operation](numbers)
+
+
 def cal(operation: str, numbers: list[float]):
     """
     A calculator function that performs operations on multiple numbers.
     
     Args:
-        operation (str): The operation to perform ('add', 'subtract', 'multiply', 'divide', 'power', 'average')
+        operation (str): The operation to perform ('add', 'subtract', 'multiply', 'divide', 'power', 'average', 'max', 'min')
         numbers (list[float]): List of numbers to perform the operation on
     
     Returns:
         float or int: Result of the operation
     """
-    print(f"Calculator called with operation: '{operation}'")
-    print(f"Arguments received: {numbers}")
-    
     if not numbers:
-        print("Error: No numbers provided")
+        _log.debug("Error: No numbers provided")
         return "Error: No numbers provided"
     
-    # Convert all arguments to numbers
-    try:
-        numbers = [float(num) for num in numbers]
-        print(f"Numbers converted to: {numbers}")
-    except (ValueError, TypeError):
-        print("Error: Invalid number format detected")
-        return "Error: All arguments must be numbers"
-    
-    operation = operation.lower()
-    print(f"Processing operation: {operation}")
-    
-    if operation == 'add':
-        print("Performing addition...")
-        result = sum(numbers)
-        print(f"Addition result: {result}")
-        return result
-    
-    elif operation == 'subtract':
-        print("Performing subtraction...")
-        result = numbers[0]
-        print(f"Starting with: {result}")
-        for num in numbers[1:]:
-            print(f"Subtracting: {num}")
-            result -= num
-        print(f"Subtraction result: {result}")
-        return result
-    
-    elif operation == 'multiply':
-        print("Performing multiplication...")
-        result = 1
-        for num in numbers:
-            print(f"Multiplying by: {num}")
-            result *= num
-        print(f"Multiplication result: {result}")
-        return result
-    
-    elif operation == 'divide':
-        if len(numbers) < 2:
-            print("Error: Division requires at least 2 numbers")
-            return "Error: Division requires at least 2 numbers"
-        print("Performing division...")
-        result = numbers[0]
-        print(f"Starting with: {result}")
-        for num in numbers[1:]:
-            if num == 0:
-                print("Error: Cannot divide by zero!")
-                return "Error: Division by zero"
-            print(f"Dividing by: {num}")
-            result /= num
-        print(f"Division result: {result}")
-        return result
-    
-    elif operation == 'power':
-        if len(numbers) != 2:
-            print("Error: Power operation requires exactly 2 numbers")
-            return "Error: Power operation requires exactly 2 numbers (base, exponent)"
-        print(f"Calculating {numbers[0]} raised to the power of {numbers[1]}...")
-        result = numbers[0] ** numbers[1]
-        print(f"Power result: {result}")
-        return result
+    if len(numbers) == 1 and operation in _SINGLETON_IDENTITY_OPS:
+        try:
+            return float(numbers[0])
+        except (ValueError, TypeError):
+            pass  # Reported by the conversion below
+    
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(
+            "Calculator called with operation %r on %r%s (%d numbers)",
+            operation,
+            numbers[:_LOG_PREVIEW_LEN],
+            "..." if len(numbers) > _LOG_PREVIEW_LEN else "",
+            len(numbers),
+        )
+    
+    # Convert all arguments to numbers, unless they already are floats
+    if not all(type(num) is float for num in numbers):
+        try:
+            numbers = [float(num) for num in numbers]
+        except (ValueError, TypeError):
+            _log.debug("Error: Invalid number format detected")
+            return "Error: All arguments must be numbers"
+    
+    # Most callers already pass a lowercase name; only normalise on a miss
+    if operation not in _OPS:
+        operation = operation.lower()
+    
+    handler = _OPS.get(operation)
+    if handler is None:
+        _log.debug("Error: Unknown operation '%s'", operation)
+        return f"Error: Unknown operation '{operation}'"
     
-    elif operation == 'average':
-        print("Calculating average...")
-        total = sum(numbers)
-        count = len(numbers)
-        print(f"Sum: {total}, Count: {count}")
-        result = total / count
-        print(f"Average result: {result}")
-        return result
+    numbers = tuple(numbers)
+    # NaN never equals itself, so such calls could never hit the cache, and
+    # 0.0 == -0.0, so a cached result could carry the wrong sign of zero
+    if any(num != num or num == 0 for num in numbers):
+        result = handler(numbers)
+    else:
+        result = _cal_cached(operation, numbers)
+    _log.debug("%s result: %s", operation, result)
+    return result
+
+
+def cal_batch(operations: list[str], numbers_batch: list[list[float]]):
+    """
+    Performs several calculator operations in a single call.
     
-    elif operation == 'max':
-        print("Finding maximum value...")
-        result = max(numbers)
-        print(f"Maximum value: {result}")
-        return result
+    Args:
+        operations (list[str]): The operation for each calculation, as accepted by cal()
+        numbers_batch (list[list[float]]): The numbers for each calculation, in the same order as operations
     
-    elif operation == 'min':
-        print("Finding minimum value...")
-        result = min(numbers)
-        print(f"Minimum value: {result}")
-        return result
+    Returns:
+        list: The result (or error message) of each calculation, in input order
+    """
+    if len(operations) != len(numbers_batch):
+        _log.debug("Error: %d operations for %d number lists", len(operations), len(numbers_batch))
+        return "Error: operations and numbers_batch must have the same length"
     
-    else:
-        print(f"Error: Unknown operation '{operation}'")
-        return f"Error: Unknown operation '{operation}'"
+    return [cal(operation, numbers) for operation, numbers in zip(operations, numbers_batch)]
 
 
 # Initialize the calculation agent
@@ -155,7 +219,11 @@ calculation_agent = Agent(
     You are a calculation agent that performs mathematical and scientific computations.
     Always show your work and explain the steps taken to reach the solution.
     Include units where applicable and round results appropriately.
+    
+    Use cal() for a single operation. When several independent calculations are
+    needed, pass them all to cal_batch() in one call instead of calling cal() repeatedly.
     """,
+    tools=[cal, cal_batch],
 )
 
 calculation_agent = AgentTool(agent=calculation_agent)
\ No newline at end of file
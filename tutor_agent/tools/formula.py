@@ -1,9 +1,256 @@
 """Physics calculator tool with scientific laws, formulas, and constants lookup."""
 
+import functools
+import json
+import logging
 import math
+from math import asin, sin
+import os
+import re
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple
 from google.adk.agents import Agent
 from google.adk.tools.agent_tool import AgentTool
 
+_log = logging.getLogger(__name__)
+
+# The constants database ships as JSON next to this module and is only read
+# on the first constants lookup
+_CONSTANTS_PATH = os.path.join(os.path.dirname(__file__), "physics_constants.json")
+
+# Dictionary containing detailed information about each physics law
+_PHYSICS_LAWS = MappingProxyType({
+    "newton_second_law": {
+        "summary": "Newton's Second Law states that the acceleration of an object is directly proportional to the net force acting on it and inversely proportional to its mass.",
+        "formula": "F = ma",
+        "phenomena": "Explains how forces cause motion - heavier objects need more force to accelerate, lighter objects accelerate more easily with the same force",
+        "parameters": ["mass (kg)", "acceleration (m/s²)"],
+        "calculates": "Force (N)"
+    },
+    "kinetic_energy": {
+        "summary": "Kinetic energy is the energy possessed by an object due to its motion. It depends on both mass and velocity.",
+        "formula": "KE = ½mv²",
+        "phenomena": "Moving objects can do work - a moving car can push another car, a flying ball can break glass",
+        "parameters": ["mass (kg)", "velocity (m/s)"],
+        "calculates": "Kinetic Energy (J)"
+    },
+    "potential_energy": {
+        "summary": "Gravitational potential energy is the energy stored in an object due to its position in a gravitational field.",
+        "formula": "PE = mgh",
+        "phenomena": "Objects at height can fall and do work - water behind a dam, a rock on a cliff",
+        "parameters": ["mass (kg)", "height (m)", "gravity (m/s², optional)"],
+        "calculates": "Potential Energy (J)"
+    },
+    "momentum": {
+        "summary": "Momentum is the quantity of motion of a moving body, equal to the product of its mass and velocity.",
+        "formula": "p = mv",
+        "phenomena": "Heavy, fast-moving objects are harder to stop - why trucks take longer to brake than cars",
+        "parameters": ["mass (kg)", "velocity (m/s)"],
+        "calculates": "Momentum (kg⋅m/s)"
+    },
+    "wave_equation": {
+        "summary": "The wave equation relates the speed of a wave to its frequency and wavelength. For light waves, speed equals the speed of light.",
+        "formula": "v = fλ (or c = fλ for light)",
+        "phenomena": "Explains all wave phenomena - sound waves, light waves, radio waves, ocean waves",
+        "parameters": ["frequency (Hz)", "wavelength (m)", "speed (m/s) - need 2 of 3"],
+        "calculates": "Missing wave parameter"
+    },
+    "ohms_law": {
+        "summary": "Ohm's Law states that current through a conductor is directly proportional to voltage and inversely proportional to resistance.",
+        "formula": "V = IR, P = VI = I²R = V²/R",
+        "phenomena": "Fundamental principle of electrical circuits - how voltage, current, and resistance relate in all electrical devices",
+        "parameters": ["voltage (V)", "current (A)", "resistance (Ω) - need 2 of 3"],
+        "calculates": "Missing electrical parameter and power"
+    },
+    "coulombs_law": {
+        "summary": "Coulomb's Law describes the electrostatic force between two point charges, proportional to their charges and inversely proportional to distance squared.",
+        "formula": "F = k|q₁q₂|/r²",
+        "phenomena": "Explains electric forces - why clothes stick after dryer, lightning, how atoms bond",
+        "parameters": ["charge1 (C)", "charge2 (C)", "distance (m)"],
+        "calculates": "Electrostatic Force (N)"
+    },
+    "ideal_gas_law": {
+        "summary": "The Ideal Gas Law relates pressure, volume, temperature, and amount of gas for an ideal gas.",
+        "formula": "PV = nRT",
+        "phenomena": "Explains gas behavior - why balloons expand when heated, how pressure cookers work, atmospheric pressure changes",
+        "parameters": ["pressure (Pa)", "volume (m³)", "moles (mol)", "temperature (K) - need 3 of 4"],
+        "calculates": "Missing gas parameter"
+    },
+    "snells_law": {
+        "summary": "Snell's Law describes how light bends when passing from one medium to another with different refractive indices.",
+        "formula": "n₁sin(θ₁) = n₂sin(θ₂)",
+        "phenomena": "Explains refraction - why objects look bent in water, how lenses work, fiber optics, mirages",
+        "parameters": ["n1 (refractive index)", "n2 (refractive index)", "theta1 (degrees)"],
+        "calculates": "Refraction angle (degrees)"
+    }
+})
+
+# Parameters that, on their own, ask physics_calc for a law's information
+_INFO_ONLY_KEYS = frozenset({"info_only"})
+
+# Fields of the "unknown law" error responses
+_AVAILABLE_LAWS = tuple(_PHYSICS_LAWS)
+_AVAILABLE_LAWS_JOINED = ", ".join(_AVAILABLE_LAWS)
+_LAW_SUMMARIES = {name: info["summary"] for name, info in _PHYSICS_LAWS.items()}
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_key(name: str) -> str:
+    """Normalize a law or constant name, e.g. "Speed of Light" -> "speed_of_light"."""
+    return name.lower().replace(" ", "_").replace("-", "_")
+
+
+# Separators between the words of constant names, descriptions and queries
+_TOKEN_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def _tokenize(text: str) -> list:
+    """Split lowercased text into its words, e.g. "wien_displacement" -> ["wien", "displacement"]."""
+    return [token for token in _TOKEN_SEPARATORS.split(text) if token]
+
+
+class Constant(NamedTuple):
+    """A physical constant record from the constants database."""
+    value: float
+    units: str
+    symbol: str
+    description: str
+    category: str
+    uncertainty: str
+
+
+class _ConstantsDB(NamedTuple):
+    """The constants table and the lookup structures derived from it."""
+    constants: Mapping[str, Constant]
+    by_category: Dict[str, Dict[str, dict]]
+    available_categories: tuple
+    overview: dict
+    search_texts: tuple
+    token_index: Dict[str, frozenset]
+    order: Dict[str, int]
+    preview: tuple
+
+
+@functools.lru_cache(maxsize=1)
+def _get_constants() -> _ConstantsDB:
+    """Load the constants database and build its lookup structures on first use."""
+    with open(_CONSTANTS_PATH, encoding="utf-8") as file:
+        constants = MappingProxyType({
+            name: Constant(**data) for name, data in json.load(file).items()
+        })
+    
+    # Category -> {constant name -> constant data}, ready to return as is
+    by_category = {}
+    for name, const in constants.items():
+        by_category.setdefault(const.category, {})[name] = const._asdict()
+    
+    # Response for a lookup with no parameters; it never changes between calls
+    overview = {
+        "overview": "Physics Constants Database",
+        "categories": {
+            cat: [
+                {
+                    "name": const_name,
+                    "symbol": const_data["symbol"],
+                    "description": const_data["description"]
+                }
+                for const_name, const_data in cat_constants.items()
+            ]
+            for cat, cat_constants in by_category.items()
+        },
+        "total_constants": len(constants),
+        "usage": "Use constant_name for specific constant or category for listing constants by type"
+    }
+    
+    # Whole-word search: each word of a constant's name or description maps
+    # to the constants using it, so a query whose words are not adjacent in
+    # any text is answered by intersecting the sets of its words
+    token_index = {}
+    for name, const in constants.items():
+        for token in _tokenize(name) + _tokenize(const.description.lower()):
+            token_index.setdefault(token, set()).add(name)
+    
+    return _ConstantsDB(
+        constants=constants,
+        by_category=by_category,
+        available_categories=tuple(by_category),
+        overview=overview,
+        # Substring search scans these, so descriptions are lowercased once
+        search_texts=tuple(
+            (name, const.description.lower()) for name, const in constants.items()
+        ),
+        token_index={token: frozenset(names) for token, names in token_index.items()},
+        order={name: index for index, name in enumerate(constants)},
+        preview=tuple(constants)[:10],
+    )
+
+
+def _find_partial_matches(search_term: str) -> list:
+    """
+    Return the names of constants matching search_term, in table order.
+    
+    Constants whose name or description contains search_term come first; if
+    there are none, the constants using every word of search_term are returned
+    instead, so "mass_electron" still finds electron_mass.
+    """
+    if not search_term:
+        return []
+    db = _get_constants()
+    matches = [
+        name for name, description in db.search_texts
+        if search_term in name or search_term in description
+    ]
+    if matches:
+        return matches
+    
+    tokens = _tokenize(search_term)
+    if not tokens:
+        return []
+    matches = frozenset.intersection(
+        *(db.token_index.get(token, frozenset()) for token in tokens)
+    )
+    return sorted(matches, key=db.order.__getitem__)
+
+
+def _lookup_constant(db: _ConstantsDB, constant_name: str) -> dict:
+    """Look up a single constant by exact name, falling back to partial matches."""
+    constant_name = _normalize_key(constant_name)
+    
+    # Try exact match first
+    if constant_name in db.constants:
+        const_data = db.constants[constant_name]
+        _log.debug("Found constant: %s", constant_name)
+        return {
+            "constant": constant_name,
+            "value": const_data.value,
+            "units": const_data.units,
+            "symbol": const_data.symbol,
+            "description": const_data.description,
+            "category": const_data.category,
+            "uncertainty": const_data.uncertainty
+        }
+    
+    # Try partial matching
+    matches = {
+        const_name: db.constants[const_name]._asdict()
+        for const_name in _find_partial_matches(constant_name)
+    }
+    
+    if matches:
+        return {
+            "partial_matches": matches,
+            "search_term": constant_name,
+            "message": "Multiple matches found. Please specify exact constant name."
+        }
+    else:
+        return {
+            "error": f"Constant '{constant_name}' not found",
+            "available_constants": db.preview,  # Show first 10
+            "total_available": len(db.constants),
+            "suggestion": "Use physics_constants_lookup() without parameters to see all categories"
+        }
+
+
 def physics_constants_lookup(constant_name: str = None, category: str = None):
     """
     Look up fundamental physical constants from a comprehensive database.
@@ -15,244 +262,17 @@ def physics_constants_lookup(constant_name: str = None, category: str = None):
     Returns:
         dict: Constant value(s), units, description, and related information
     """
-    print("-------------Physics Constants Lookup called----------")
-    
-    # Comprehensive physics constants database
-    PHYSICS_CONSTANTS = {
-        # Fundamental Constants
-        "speed_of_light": {
-            "value": 299792458,
-            "units": "m/s",
-            "symbol": "c",
-            "description": "Speed of light in vacuum",
-            "category": "fundamental",
-            "uncertainty": "exact (defined)"
-        },
-        "planck_constant": {
-            "value": 6.62607015e-34,
-            "units": "J⋅s",
-            "symbol": "h",
-            "description": "Planck constant",
-            "category": "fundamental",
-            "uncertainty": "exact (defined)"
-        },
-        "reduced_planck_constant": {
-            "value": 1.054571817e-34,
-            "units": "J⋅s",
-            "symbol": "ℏ",
-            "description": "Reduced Planck constant (h/2π)",
-            "category": "fundamental",
-            "uncertainty": "exact (defined)"
-        },
-        "elementary_charge": {
-            "value": 1.602176634e-19,
-            "units": "C",
-            "symbol": "e",
-            "description": "Elementary charge",
-            "category": "fundamental",
-            "uncertainty": "exact (defined)"
-        },
-        "gravitational_constant": {
-            "value": 6.67430e-11,
-            "units": "m³/(kg⋅s²)",
-            "symbol": "G",
-            "description": "Gravitational constant",
-            "category": "fundamental",
-            "uncertainty": "2.2e-5"
-        },
-        
-        # Electromagnetic Constants
-        "vacuum_permeability": {
-            "value": 1.25663706212e-6,
-            "units": "H/m",
-            "symbol": "μ₀",
-            "description": "Vacuum permeability",
-            "category": "electromagnetic",
-            "uncertainty": "1.9e-10"
-        },
-        "vacuum_permittivity": {
-            "value": 8.8541878128e-12,
-            "units": "F/m",
-            "symbol": "ε₀",
-            "description": "Vacuum permittivity",
-            "category": "electromagnetic",
-            "uncertainty": "1.3e-10"
-        },
-        "coulomb_constant": {
-            "value": 8.9875517923e9,
-            "units": "N⋅m²/C²",
-            "symbol": "k",
-            "description": "Coulomb constant (1/(4πε₀))",
-            "category": "electromagnetic",
-            "uncertainty": "exact (derived)"
-        },
-        
-        # Atomic and Molecular Constants
-        "avogadro_number": {
-            "value": 6.02214076e23,
-            "units": "1/mol",
-            "symbol": "Nₐ",
-            "description": "Avogadro number",
-            "category": "atomic",
-            "uncertainty": "exact (defined)"
-        },
-        "boltzmann_constant": {
-            "value": 1.380649e-23,
-            "units": "J/K",
-            "symbol": "k_B",
-            "description": "Boltzmann constant",
-            "category": "atomic",
-            "uncertainty": "exact (defined)"
-        },
-        "gas_constant": {
-            "value": 8.314462618,
-            "units": "J/(mol⋅K)",
-            "symbol": "R",
-            "description": "Universal gas constant",
-            "category": "atomic",
-            "uncertainty": "exact (derived)"
-        },
-        "electron_mass": {
-            "value": 9.1093837015e-31,
-            "units": "kg",
-            "symbol": "mₑ",
-            "description": "Electron rest mass",
-            "category": "atomic",
-            "uncertainty": "3.0e-10"
-        },
-        "proton_mass": {
-            "value": 1.67262192369e-27,
-            "units": "kg",
-            "symbol": "mₚ",
-            "description": "Proton rest mass",
-            "category": "atomic",
-            "uncertainty": "3.1e-10"
-        },
-        "neutron_mass": {
-            "value": 1.67492749804e-27,
-            "units": "kg",
-            "symbol": "mₙ",
-            "description": "Neutron rest mass",
-            "category": "atomic",
-            "uncertainty": "9.5e-10"
-        },
-        "atomic_mass_unit": {
-            "value": 1.66053906660e-27,
-            "units": "kg",
-            "symbol": "u",
-            "description": "Atomic mass unit",
-            "category": "atomic",
-            "uncertainty": "5.0e-10"
-        },
-        
-        # Earth and Astronomical Constants
-        "standard_gravity": {
-            "value": 9.80665,
-            "units": "m/s²",
-            "symbol": "g",
-            "description": "Standard acceleration due to gravity",
-            "category": "earth",
-            "uncertainty": "exact (defined)"
-        },
-        "earth_mass": {
-            "value": 5.972e24,
-            "units": "kg",
-            "symbol": "M⊕",
-            "description": "Earth mass",
-            "category": "earth",
-            "uncertainty": "4.4e-4"
-        },
-        "earth_radius": {
-            "value": 6.371e6,
-            "units": "m",
-            "symbol": "R⊕",
-            "description": "Earth mean radius",
-            "category": "earth",
-            "uncertainty": "varies"
-        },
-        "solar_mass": {
-            "value": 1.98847e30,
-            "units": "kg",
-            "symbol": "M☉",
-            "description": "Solar mass",
-            "category": "astronomical",
-            "uncertainty": "2.0e-4"
-        },
-        "astronomical_unit": {
-            "value": 1.495978707e11,
-            "units": "m",
-            "symbol": "au",
-            "description": "Astronomical unit",
-            "category": "astronomical",
-            "uncertainty": "exact (defined)"
-        },
-        
-        # Thermodynamic Constants
-        "stefan_boltzmann_constant": {
-            "value": 5.670374419e-8,
-            "units": "W/(m²⋅K⁴)",
-            "symbol": "σ",
-            "description": "Stefan-Boltzmann constant",
-            "category": "thermodynamic",
-            "uncertainty": "exact (derived)"
-        },
-        "wien_displacement_constant": {
-            "value": 2.897771955e-3,
-            "units": "m⋅K",
-            "symbol": "b",
-            "description": "Wien displacement law constant",
-            "category": "thermodynamic",
-            "uncertainty": "exact (derived)"
-        },
-        
-        # Nuclear Constants
-        "fine_structure_constant": {
-            "value": 7.2973525693e-3,
-            "units": "dimensionless",
-            "symbol": "α",
-            "description": "Fine-structure constant",
-            "category": "nuclear",
-            "uncertainty": "1.5e-10"
-        },
-        "rydberg_constant": {
-            "value": 1.0973731568160e7,
-            "units": "1/m",
-            "symbol": "R∞",
-            "description": "Rydberg constant",
-            "category": "nuclear",
-            "uncertainty": "1.9e-12"
-        }
-    }
-    
-    print(f"Constants lookup called with constant_name: '{constant_name}', category: '{category}'")
+    _log.debug("Constants lookup called with constant_name %r, category %r", constant_name, category)
+    db = _get_constants()
     
     # If no parameters provided, return overview
     if not constant_name and not category:
-        categories = {}
-        for const_name, const_data in PHYSICS_CONSTANTS.items():
-            cat = const_data["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append({
-                "name": const_name,
-                "symbol": const_data["symbol"],
-                "description": const_data["description"]
-            })
-        
-        return {
-            "overview": "Physics Constants Database",
-            "categories": categories,
-            "total_constants": len(PHYSICS_CONSTANTS),
-            "usage": "Use constant_name for specific constant or category for listing constants by type"
-        }
+        return db.overview
     
     # If category specified, return all constants in that category
     if category:
         category = category.lower()
-        category_constants = {}
-        for const_name, const_data in PHYSICS_CONSTANTS.items():
-            if const_data["category"] == category:
-                category_constants[const_name] = const_data
+        category_constants = db.by_category.get(category)
         
         if category_constants:
             return {
@@ -261,140 +281,418 @@ def physics_constants_lookup(constant_name: str = None, category: str = None):
                 "count": len(category_constants)
             }
         else:
-            available_categories = list(set(data["category"] for data in PHYSICS_CONSTANTS.values()))
             return {
                 "error": f"Category '{category}' not found",
-                "available_categories": available_categories
+                "available_categories": db.available_categories
             }
     
     # If specific constant requested
     if constant_name:
-        constant_name = constant_name.lower().replace(" ", "_").replace("-", "_")
-        
-        # Try exact match first
-        if constant_name in PHYSICS_CONSTANTS:
-            const_data = PHYSICS_CONSTANTS[constant_name]
-            print(f"Found constant: {constant_name}")
-            return {
-                "constant": constant_name,
-                "value": const_data["value"],
-                "units": const_data["units"],
-                "symbol": const_data["symbol"],
-                "description": const_data["description"],
-                "category": const_data["category"],
-                "uncertainty": const_data["uncertainty"]
-            }
-        
-        # Try partial matching
-        matches = {}
-        for const_name, const_data in PHYSICS_CONSTANTS.items():
-            if constant_name in const_name or constant_name in const_data["description"].lower():
-                matches[const_name] = const_data
-        
-        if matches:
-            return {
-                "partial_matches": matches,
-                "search_term": constant_name,
-                "message": "Multiple matches found. Please specify exact constant name."
-            }
-        else:
-            available_constants = list(PHYSICS_CONSTANTS.keys())
-            return {
-                "error": f"Constant '{constant_name}' not found",
-                "available_constants": available_constants[:10],  # Show first 10
-                "total_available": len(available_constants),
-                "suggestion": "Use physics_constants_lookup() without parameters to see all categories"
-            }
+        return _lookup_constant(db, constant_name)
 
-def physics_calc(law: str, **kwargs):
+
+def physics_constants_lookup_batch(constant_names: list[str]):
+    """
+    Look up several physical constants in a single call.
+    
+    Args:
+        constant_names (list[str]): Names of the constants to look up
+    
+    Returns:
+        dict: The lookup result for each requested name, keyed by the name as given
+    """
+    _log.debug("Batch constants lookup called for %d names", len(constant_names))
+    db = _get_constants()
+    return {name: _lookup_constant(db, name) for name in constant_names}
+
+
+# Fields shared by every successful result for a law; handlers copy the
+# template and add the computed values
+_LAW_RESULT_TEMPLATE = {
+    law: {
+        "formula": info["formula"],
+        "law_summary": info["summary"],
+        "phenomena": info["phenomena"]
+    }
+    for law, info in _PHYSICS_LAWS.items()
+}
+
+
+# Error responses for calls missing the parameters a law needs. They are built
+# once and shared, so callers must not modify them
+_MISSING_PARAM_ERRORS = {
+    "newton_second_law": {"error": "Missing required parameters: mass (kg) and acceleration (m/s²)"},
+    "kinetic_energy": {"error": "Missing required parameters: mass (kg) and velocity (m/s)"},
+    "potential_energy": {"error": "Missing required parameters: mass (kg) and height (m)"},
+    "momentum": {"error": "Missing required parameters: mass (kg) and velocity (m/s)"},
+    "wave_equation": {"error": "Need at least 2 of: frequency, wavelength, speed"},
+    "ohms_law": {"error": "Need at least 2 of: voltage (V), current (I), resistance (R)"},
+    "coulombs_law": {"error": "Missing required parameters: charge1 (C), charge2 (C), distance (m)"},
+    "ideal_gas_law": {"error": "Need at least 3 of: pressure (Pa), volume (m³), moles (mol), temperature (K)"},
+    "snells_law": {"error": "Need refractive indices n1, n2 and incident angle theta1"}
+}
+
+
+def _get(kwargs: dict, *names: str):
+    """Return the value of the first of names present in kwargs, or None if none are."""
+    for name in names:
+        if name in kwargs:
+            return kwargs[name]
+    return None
+
+
+# MECHANICS LAWS
+
+_EXPL_FORCE = "Force = {m} kg × {a} m/s² = {force} N"
+
+
+def _calc_newton_second_law(kwargs: dict, include_explanation: bool):
+    # F = ma
+    m = _get(kwargs, 'mass', 'm')
+    a = _get(kwargs, 'acceleration', 'a')
+    if m is None or a is None:
+        return _MISSING_PARAM_ERRORS["newton_second_law"]
+    
+    force = m * a
+    _log.debug("Applying Newton's Second Law: F = ma = %s × %s = %s", m, a, force)
+    out = _LAW_RESULT_TEMPLATE["newton_second_law"].copy()
+    out["result"] = force
+    out["units"] = "N (Newtons)"
+    if include_explanation:
+        out["explanation"] = _EXPL_FORCE.format(m=m, a=a, force=force)
+    return out
+
+
+_EXPL_KINETIC_ENERGY = "Kinetic Energy = ½ × {m} kg × ({v} m/s)² = {ke} J"
+
+
+def _calc_kinetic_energy(kwargs: dict, include_explanation: bool):
+    # KE = (1/2)mv²
+    m = _get(kwargs, 'mass', 'm')
+    v = _get(kwargs, 'velocity', 'v')
+    if m is None or v is None:
+        return _MISSING_PARAM_ERRORS["kinetic_energy"]
+    
+    ke = 0.5 * m * v**2
+    _log.debug("Calculating kinetic energy: KE = ½mv² = ½ × %s × %s² = %s", m, v, ke)
+    out = _LAW_RESULT_TEMPLATE["kinetic_energy"].copy()
+    out["result"] = ke
+    out["units"] = "J (Joules)"
+    if include_explanation:
+        out["explanation"] = _EXPL_KINETIC_ENERGY.format(m=m, v=v, ke=ke)
+    return out
+
+
+_EXPL_POTENTIAL_ENERGY = "Potential Energy = {m} kg × {g} m/s² × {h} m = {pe} J"
+
+
+def _calc_potential_energy(kwargs: dict, include_explanation: bool):
+    # PE = mgh
+    m = _get(kwargs, 'mass', 'm')
+    g = _get(kwargs, 'gravity', 'g')
+    g = 9.81 if g is None else g
+    h = _get(kwargs, 'height', 'h')
+    if m is None or h is None:
+        return _MISSING_PARAM_ERRORS["potential_energy"]
+    
+    pe = m * g * h
+    _log.debug("Calculating gravitational potential energy: PE = mgh = %s × %s × %s = %s", m, g, h, pe)
+    out = _LAW_RESULT_TEMPLATE["potential_energy"].copy()
+    out["result"] = pe
+    out["units"] = "J (Joules)"
+    if include_explanation:
+        out["explanation"] = _EXPL_POTENTIAL_ENERGY.format(m=m, g=g, h=h, pe=pe)
+    return out
+
+
+_EXPL_MOMENTUM = "Momentum = {m} kg × {v} m/s = {momentum} kg⋅m/s"
+
+
+def _calc_momentum(kwargs: dict, include_explanation: bool):
+    # p = mv
+    m = _get(kwargs, 'mass', 'm')
+    v = _get(kwargs, 'velocity', 'v')
+    if m is None or v is None:
+        return _MISSING_PARAM_ERRORS["momentum"]
+    
+    momentum = m * v
+    _log.debug("Calculating momentum: p = mv = %s × %s = %s", m, v, momentum)
+    out = _LAW_RESULT_TEMPLATE["momentum"].copy()
+    out["result"] = momentum
+    out["units"] = "kg⋅m/s"
+    if include_explanation:
+        out["explanation"] = _EXPL_MOMENTUM.format(m=m, v=v, momentum=momentum)
+    return out
+
+
+# WAVE PHYSICS
+
+_EXPL_WAVE_SPEED = "Wave speed = {f} Hz × {wavelength} m = {speed} m/s"
+_EXPL_WAVELENGTH = "Wavelength = {c} m/s ÷ {f} Hz = {wavelength} m"
+_EXPL_FREQUENCY = "Frequency = {c} m/s ÷ {wavelength} m = {frequency} Hz"
+
+
+def _calc_wave_equation(kwargs: dict, include_explanation: bool):
+    # v = fλ or c = fλ for light
+    f = _get(kwargs, 'frequency', 'f')
+    wavelength = _get(kwargs, 'wavelength', 'lambda', 'l')
+    c = _get(kwargs, 'speed', 'c')
+    c = 3e8 if c is None else c  # Default to speed of light
+    
+    if f is not None and wavelength is not None:
+        speed = f * wavelength
+        out = _LAW_RESULT_TEMPLATE["wave_equation"].copy()
+        out["result"] = speed
+        out["units"] = "m/s"
+        if include_explanation:
+            out["explanation"] = _EXPL_WAVE_SPEED.format(f=f, wavelength=wavelength, speed=speed)
+        return out
+    elif f is not None and c is not None:
+        if f == 0:
+            return {"error": "Frequency cannot be zero when calculating wavelength"}
+        wavelength = c / f
+        out = _LAW_RESULT_TEMPLATE["wave_equation"].copy()
+        out["result"] = wavelength
+        out["units"] = "m"
+        out["formula"] = "λ = c/f"
+        if include_explanation:
+            out["explanation"] = _EXPL_WAVELENGTH.format(c=c, f=f, wavelength=wavelength)
+        return out
+    elif wavelength is not None and c is not None:
+        if wavelength == 0:
+            return {"error": "Wavelength cannot be zero when calculating frequency"}
+        frequency = c / wavelength
+        out = _LAW_RESULT_TEMPLATE["wave_equation"].copy()
+        out["result"] = frequency
+        out["units"] = "Hz"
+        out["formula"] = "f = c/λ"
+        if include_explanation:
+            out["explanation"] = _EXPL_FREQUENCY.format(c=c, wavelength=wavelength, frequency=frequency)
+        return out
+    else:
+        return _MISSING_PARAM_ERRORS["wave_equation"]
+
+
+# ELECTRICITY AND MAGNETISM
+
+_EXPL_RESISTANCE = "R = V/I = {V}V / {I}A = {resistance}Ω, P = {V}V × {I}A = {power}W"
+_EXPL_CURRENT = "I = {V}V / {R}Ω = {current}A, P = ({V}V)² / {R}Ω = {power}W"
+_EXPL_VOLTAGE = "V = {I}A × {R}Ω = {voltage}V, P = ({I}A)² × {R}Ω = {power}W"
+
+
+def _calc_ohms_law(kwargs: dict, include_explanation: bool):
+    # V = IR, P = VI, P = I²R, P = V²/R
+    V = _get(kwargs, 'voltage', 'V')
+    I = _get(kwargs, 'current', 'I')
+    R = _get(kwargs, 'resistance', 'R')
+    
+    if V is not None and I is not None:
+        if I == 0:
+            return {"error": "Current cannot be zero when calculating resistance"}
+        resistance = V / I
+        power = V * I
+        out = _LAW_RESULT_TEMPLATE["ohms_law"].copy()
+        out["result"] = {"resistance": resistance, "power": power}
+        out["units"] = {"resistance": "Ω (Ohms)", "power": "W (Watts)"}
+        if include_explanation:
+            out["explanation"] = _EXPL_RESISTANCE.format(V=V, I=I, resistance=resistance, power=power)
+        return out
+    elif V is not None and R is not None:
+        if R == 0:
+            return {"error": "Resistance cannot be zero when calculating current"}
+        current = V / R
+        power = V**2 / R
+        out = {
+            "result": {"current": current, "power": power},
+            "units": {"current": "A (Amperes)", "power": "W (Watts)"},
+            "formula": "I = V/R, P = V²/R"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_CURRENT.format(V=V, R=R, current=current, power=power)
+        return out
+    elif I is not None and R is not None:
+        voltage = I * R
+        power = I**2 * R
+        out = {
+            "result": {"voltage": voltage, "power": power},
+            "units": {"voltage": "V (Volts)", "power": "W (Watts)"},
+            "formula": "V = IR, P = I²R"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_VOLTAGE.format(I=I, R=R, voltage=voltage, power=power)
+        return out
+    else:
+        return _MISSING_PARAM_ERRORS["ohms_law"]
+
+
+_EXPL_COULOMB_FORCE = "Force = {k} × |{q1} × {q2}| C² / ({r} m)² = {force} N"
+
+
+def _calc_coulombs_law(kwargs: dict, include_explanation: bool):
+    # F = k(q₁q₂)/r²
+    k = _get(kwargs, 'k')
+    k = 8.99e9 if k is None else k  # Coulomb's constant
+    q1 = _get(kwargs, 'charge1', 'q1')
+    q2 = _get(kwargs, 'charge2', 'q2')
+    r = _get(kwargs, 'distance', 'r')
+    
+    if q1 is None or q2 is None or r is None:
+        return _MISSING_PARAM_ERRORS["coulombs_law"]
+    # A tiny nonzero distance can still underflow to zero when squared
+    r_squared = r**2
+    if r_squared == 0:
+        return {"error": "Distance cannot be zero"}
+    
+    force = k * abs(q1 * q2) / r_squared
+    _log.debug("Applying Coulomb's Law: F = k|q₁q₂|/r² = %s × |%s × %s| / %s² = %s", k, q1, q2, r, force)
+    out = _LAW_RESULT_TEMPLATE["coulombs_law"].copy()
+    out["result"] = force
+    out["units"] = "N (Newtons)"
+    if include_explanation:
+        out["explanation"] = _EXPL_COULOMB_FORCE.format(k=k, q1=q1, q2=q2, r=r, force=force)
+    return out
+
+
+# THERMODYNAMICS
+
+_EXPL_PRESSURE = "Pressure = {n} mol × {R} J/(mol⋅K) × {T} K / {V} m³ = {pressure} Pa"
+_EXPL_VOLUME = "Volume = {n} mol × {R} J/(mol⋅K) × {T} K / {P} Pa = {volume} m³"
+_EXPL_TEMPERATURE = "Temperature = {P} Pa × {V} m³ / ({n} mol × {R} J/(mol⋅K)) = {temperature} K"
+_EXPL_MOLES = "Moles = {P} Pa × {V} m³ / ({R} J/(mol⋅K) × {T} K) = {moles} mol"
+
+
+def _calc_ideal_gas_law(kwargs: dict, include_explanation: bool):
+    # PV = nRT
+    P = _get(kwargs, 'pressure', 'P')
+    V = _get(kwargs, 'volume', 'V')
+    n = _get(kwargs, 'moles', 'n')
+    R = _get(kwargs, 'R')
+    R = 8.314 if R is None else R  # Gas constant
+    T = _get(kwargs, 'temperature', 'T')
+    
+    known_vars = sum(1 for x in (P, V, n, T) if x is not None)
+    if known_vars < 3:
+        return _MISSING_PARAM_ERRORS["ideal_gas_law"]
+    
+    if P is None:
+        if V == 0:
+            return {"error": "Volume cannot be zero when calculating pressure"}
+        pressure = (n * R * T) / V
+        out = {
+            "result": pressure,
+            "units": "Pa (Pascals)",
+            "formula": "P = nRT/V"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_PRESSURE.format(n=n, R=R, T=T, V=V, pressure=pressure)
+        return out
+    elif V is None:
+        if P == 0:
+            return {"error": "Pressure cannot be zero when calculating volume"}
+        volume = (n * R * T) / P
+        out = {
+            "result": volume,
+            "units": "m³",
+            "formula": "V = nRT/P"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_VOLUME.format(n=n, R=R, T=T, P=P, volume=volume)
+        return out
+    elif T is None:
+        if n * R == 0:
+            return {"error": "Moles and gas constant must be non-zero when calculating temperature"}
+        temperature = (P * V) / (n * R)
+        out = {
+            "result": temperature,
+            "units": "K (Kelvin)",
+            "formula": "T = PV/(nR)"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_TEMPERATURE.format(P=P, V=V, n=n, R=R, temperature=temperature)
+        return out
+    elif n is None:
+        if R * T == 0:
+            return {"error": "Temperature and gas constant must be non-zero when calculating moles"}
+        moles = (P * V) / (R * T)
+        out = {
+            "result": moles,
+            "units": "mol",
+            "formula": "n = PV/(RT)"
+        }
+        if include_explanation:
+            out["explanation"] = _EXPL_MOLES.format(P=P, V=V, R=R, T=T, moles=moles)
+        return out
+
+
+# OPTICS
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+_EXPL_REFRACTION_ANGLE = "θ₂ = arcsin({n1}×sin({theta1}°)/{n2}) = {theta2_deg:.2f}°"
+
+
+def _calc_snells_law(kwargs: dict, include_explanation: bool):
+    # n₁sin(θ₁) = n₂sin(θ₂)
+    n1 = _get(kwargs, 'n1', 'index1')
+    n2 = _get(kwargs, 'n2', 'index2')
+    theta1 = _get(kwargs, 'theta1', 'angle1')
+    theta2 = _get(kwargs, 'theta2', 'angle2')
+    
+    if n1 is not None and n2 is not None and theta1 is not None:
+        if n2 == 0:
+            return {"error": "Refractive index n2 cannot be zero"}
+        theta1_rad = theta1 * _DEG2RAD
+        sin_theta2 = (n1 * sin(theta1_rad)) / n2
+        if abs(sin_theta2) > 1:
+            return {"error": "Total internal reflection occurs - no refracted ray"}
+        theta2_deg = asin(sin_theta2) * _RAD2DEG
+        out = _LAW_RESULT_TEMPLATE["snells_law"].copy()
+        out["result"] = theta2_deg
+        out["units"] = "degrees"
+        if include_explanation:
+            out["explanation"] = _EXPL_REFRACTION_ANGLE.format(n1=n1, theta1=theta1, n2=n2, theta2_deg=theta2_deg)
+        return out
+    else:
+        return _MISSING_PARAM_ERRORS["snells_law"]
+
+
+# Law name -> calculation handler. "force" is an alias of Newton's Second Law.
+_LAW_DISPATCH = {
+    "newton_second_law": _calc_newton_second_law,
+    "force": _calc_newton_second_law,
+    "kinetic_energy": _calc_kinetic_energy,
+    "potential_energy": _calc_potential_energy,
+    "momentum": _calc_momentum,
+    "wave_equation": _calc_wave_equation,
+    "ohms_law": _calc_ohms_law,
+    "coulombs_law": _calc_coulombs_law,
+    "ideal_gas_law": _calc_ideal_gas_law,
+    "snells_law": _calc_snells_law,
+}
+
+
+def physics_calc(law: str, include_explanation: bool = True, **kwargs):
     """
     A physics calculator function that applies scientific laws and formulas.
     
     Args:
         law (str): The physics law/formula to apply
+        include_explanation (bool, optional): Whether to add a worked explanation to the result
         **kwargs: Named parameters specific to each law
     
     Returns:
         dict: Result with value, units, and explanation
     """
-    print("-------------Physics tool called----------")
-    # Dictionary containing detailed information about each physics law
-    PHYSICS_LAWS = {
-        "newton_second_law": {
-            "summary": "Newton's Second Law states that the acceleration of an object is directly proportional to the net force acting on it and inversely proportional to its mass.",
-            "formula": "F = ma",
-            "phenomena": "Explains how forces cause motion - heavier objects need more force to accelerate, lighter objects accelerate more easily with the same force",
-            "parameters": ["mass (kg)", "acceleration (m/s²)"],
-            "calculates": "Force (N)"
-        },
-        "kinetic_energy": {
-            "summary": "Kinetic energy is the energy possessed by an object due to its motion. It depends on both mass and velocity.",
-            "formula": "KE = ½mv²",
-            "phenomena": "Moving objects can do work - a moving car can push another car, a flying ball can break glass",
-            "parameters": ["mass (kg)", "velocity (m/s)"],
-            "calculates": "Kinetic Energy (J)"
-        },
-        "potential_energy": {
-            "summary": "Gravitational potential energy is the energy stored in an object due to its position in a gravitational field.",
-            "formula": "PE = mgh",
-            "phenomena": "Objects at height can fall and do work - water behind a dam, a rock on a cliff",
-            "parameters": ["mass (kg)", "height (m)", "gravity (m/s², optional)"],
-            "calculates": "Potential Energy (J)"
-        },
-        "momentum": {
-            "summary": "Momentum is the quantity of motion of a moving body, equal to the product of its mass and velocity.",
-            "formula": "p = mv",
-            "phenomena": "Heavy, fast-moving objects are harder to stop - why trucks take longer to brake than cars",
-            "parameters": ["mass (kg)", "velocity (m/s)"],
-            "calculates": "Momentum (kg⋅m/s)"
-        },
-        "wave_equation": {
-            "summary": "The wave equation relates the speed of a wave to its frequency and wavelength. For light waves, speed equals the speed of light.",
-            "formula": "v = fλ (or c = fλ for light)",
-            "phenomena": "Explains all wave phenomena - sound waves, light waves, radio waves, ocean waves",
-            "parameters": ["frequency (Hz)", "wavelength (m)", "speed (m/s) - need 2 of 3"],
-            "calculates": "Missing wave parameter"
-        },
-        "ohms_law": {
-            "summary": "Ohm's Law states that current through a conductor is directly proportional to voltage and inversely proportional to resistance.",
-            "formula": "V = IR, P = VI = I²R = V²/R",
-            "phenomena": "Fundamental principle of electrical circuits - how voltage, current, and resistance relate in all electrical devices",
-            "parameters": ["voltage (V)", "current (A)", "resistance (Ω) - need 2 of 3"],
-            "calculates": "Missing electrical parameter and power"
-        },
-        "coulombs_law": {
-            "summary": "Coulomb's Law describes the electrostatic force between two point charges, proportional to their charges and inversely proportional to distance squared.",
-            "formula": "F = k|q₁q₂|/r²",
-            "phenomena": "Explains electric forces - why clothes stick after dryer, lightning, how atoms bond",
-            "parameters": ["charge1 (C)", "charge2 (C)", "distance (m)"],
-            "calculates": "Electrostatic Force (N)"
-        },
-        "ideal_gas_law": {
-            "summary": "The Ideal Gas Law relates pressure, volume, temperature, and amount of gas for an ideal gas.",
-            "formula": "PV = nRT",
-            "phenomena": "Explains gas behavior - why balloons expand when heated, how pressure cookers work, atmospheric pressure changes",
-            "parameters": ["pressure (Pa)", "volume (m³)", "moles (mol)", "temperature (K) - need 3 of 4"],
-            "calculates": "Missing gas parameter"
-        },
-        "snells_law": {
-            "summary": "Snell's Law describes how light bends when passing from one medium to another with different refractive indices.",
-            "formula": "n₁sin(θ₁) = n₂sin(θ₂)",
-            "phenomena": "Explains refraction - why objects look bent in water, how lenses work, fiber optics, mirages",
-            "parameters": ["n1 (refractive index)", "n2 (refractive index)", "theta1 (degrees)"],
-            "calculates": "Refraction angle (degrees)"
-        }
-    }
-    
-    print(f"Physics calculator called with law: '{law}'")
-    print(f"Parameters received: {kwargs}")
+    _log.debug("Physics calculator called with law %r and parameters %r", law, kwargs)
     
-    law = law.lower().replace(" ", "_").replace("-", "_")
+    law = _normalize_key(law)
     
     # If requesting law information only
-    if kwargs.get('info_only', False) or not kwargs or (len(kwargs) == 1 and 'info_only' in kwargs):
-        if law in PHYSICS_LAWS:
-            law_info = PHYSICS_LAWS[law]
-            print(f"Providing information for law: {law}")
+    if kwargs.keys() <= _INFO_ONLY_KEYS or kwargs.get('info_only'):
+        if law in _PHYSICS_LAWS:
+            law_info = _PHYSICS_LAWS[law]
+            _log.debug("Providing information for law: %s", law)
             return {
                 "law_info": law_info,
                 "summary": law_info["summary"],
@@ -404,269 +702,26 @@ def physics_calc(law: str, **kwargs):
                 "calculates": law_info["calculates"]
             }
         else:
-            available_laws = list(PHYSICS_LAWS.keys())
-            return {"error": f"Unknown law '{law}'. Available laws: {', '.join(available_laws)}"}
+            return {"error": f"Unknown law '{law}'. Available laws: {_AVAILABLE_LAWS_JOINED}"}
     
-    # Get law information for context
-    law_info = PHYSICS_LAWS.get(law, {})
+    handler = _LAW_DISPATCH.get(law)
+    if handler is None:
+        return {
+            "error": f"Unknown law '{law}'. Available laws: {_AVAILABLE_LAWS_JOINED}",
+            "available_laws": _LAW_SUMMARIES
+        }
     
+    # Zero divisors are checked by the handlers. Parameters that are not
+    # numbers, and numbers whose result overflows or is undefined, are
+    # reported as errors rather than escaping into the agent run
     try:
-        # MECHANICS LAWS
-        if law == "newton_second_law" or law == "force":
-            # F = ma
-            m = kwargs.get('mass', kwargs.get('m'))
-            a = kwargs.get('acceleration', kwargs.get('a'))
-            if m is None or a is None:
-                return {"error": "Missing required parameters: mass (kg) and acceleration (m/s²)"}
-            
-            force = m * a
-            print(f"Applying Newton's Second Law: F = ma = {m} × {a} = {force}")
-            return {
-                "result": force,
-                "units": "N (Newtons)",
-                "formula": law_info.get("formula", "F = ma"),
-                "explanation": f"Force = {m} kg × {a} m/s² = {force} N",
-                "law_summary": law_info.get("summary", ""),
-                "phenomena": law_info.get("phenomena", "")
-            }
-        
-        elif law == "kinetic_energy":
-            # KE = (1/2)mv²
-            m = kwargs.get('mass', kwargs.get('m'))
-            v = kwargs.get('velocity', kwargs.get('v'))
-            if m is None or v is None:
-                return {"error": "Missing required parameters: mass (kg) and velocity (m/s)"}
-            
-            ke = 0.5 * m * v**2
-            print(f"Calculating kinetic energy: KE = ½mv² = ½ × {m} × {v}² = {ke}")
-            return {
-                "result": ke,
-                "units": "J (Joules)",
-                "formula": law_info.get("formula", "KE = ½mv²"),
-                "explanation": f"Kinetic Energy = ½ × {m} kg × ({v} m/s)² = {ke} J",
-                "law_summary": law_info.get("summary", ""),
-                "phenomena": law_info.get("phenomena", "")
-            }
-        
-        elif law == "potential_energy":
-            # PE = mgh
-            m = kwargs.get('mass', kwargs.get('m'))
-            g = kwargs.get('gravity', kwargs.get('g', 9.81))
-            h = kwargs.get('height', kwargs.get('h'))
-            if m is None or h is None:
-                return {"error": "Missing required parameters: mass (kg) and height (m)"}
-            
-            pe = m * g * h
-            print(f"Calculating gravitational potential energy: PE = mgh = {m} × {g} × {h} = {pe}")
-            return {
-                "result": pe,
-                "units": "J (Joules)",
-                "formula": law_info.get("formula", "PE = mgh"),
-                "explanation": f"Potential Energy = {m} kg × {g} m/s² × {h} m = {pe} J",
-                "law_summary": law_info.get("summary", ""),
-                "phenomena": law_info.get("phenomena", "")
-            }
-        
-        elif law == "momentum":
-            # p = mv
-            m = kwargs.get('mass', kwargs.get('m'))
-            v = kwargs.get('velocity', kwargs.get('v'))
-            if m is None or v is None:
-                return {"error": "Missing required parameters: mass (kg) and velocity (m/s)"}
-            
-            momentum = m * v
-            print(f"Calculating momentum: p = mv = {m} × {v} = {momentum}")
-            return {
-                "result": momentum,
-                "units": "kg⋅m/s",
-                "formula": law_info.get("formula", "p = mv"),
-                "explanation": f"Momentum = {m} kg × {v} m/s = {momentum} kg⋅m/s",
-                "law_summary": law_info.get("summary", ""),
-                "phenomena": law_info.get("phenomena", "")
-            }
-        
-        # WAVE PHYSICS
-        elif law == "wave_equation":
-            # v = fλ or c = fλ for light
-            f = kwargs.get('frequency', kwargs.get('f'))
-            wavelength = kwargs.get('wavelength', kwargs.get('lambda', kwargs.get('l')))
-            c = kwargs.get('speed', kwargs.get('c', 3e8))  # Default to speed of light
-            
-            if f and wavelength:
-                speed = f * wavelength
-                return {
-                    "result": speed,
-                    "units": "m/s",
-                    "formula": law_info.get("formula", "v = fλ"),
-                    "explanation": f"Wave speed = {f} Hz × {wavelength} m = {speed} m/s",
-                    "law_summary": law_info.get("summary", ""),
-                    "phenomena": law_info.get("phenomena", "")
-                }
-            elif f and c:
-                wavelength = c / f
-                return {
-                    "result": wavelength,
-                    "units": "m",
-                    "formula": "λ = c/f",
-                    "explanation": f"Wavelength = {c} m/s ÷ {f} Hz = {wavelength} m",
-                    "law_summary": law_info.get("summary", ""),
-                    "phenomena": law_info.get("phenomena", "")
-                }
-            elif wavelength and c:
-                frequency = c / wavelength
-                return {
-                    "result": frequency,
-                    "units": "Hz",
-                    "formula": "f = c/λ",
-                    "explanation": f"Frequency = {c} m/s ÷ {wavelength} m = {frequency} Hz",
-                    "law_summary": law_info.get("summary", ""),
-                    "phenomena": law_info.get("phenomena", "")
-                }
-            else:
-                return {"error": "Need at least 2 of: frequency, wavelength, speed"}
-        
-        # ELECTRICITY AND MAGNETISM
-        elif law == "ohms_law":
-            # V = IR, P = VI, P = I²R, P = V²/R
-            V = kwargs.get('voltage', kwargs.get('V'))
-            I = kwargs.get('current', kwargs.get('I'))
-            R = kwargs.get('resistance', kwargs.get('R'))
-            
-            if V and I:
-                resistance = V / I
-                power = V * I
-                return {
-                    "result": {"resistance": resistance, "power": power},
-                    "units": {"resistance": "Ω (Ohms)", "power": "W (Watts)"},
-                    "formula": law_info.get("formula", "V = IR, P = VI"),
-                    "explanation": f"R = V/I = {V}V / {I}A = {resistance}Ω, P = {V}V × {I}A = {power}W",
-                    "law_summary": law_info.get("summary", ""),
-                    "phenomena": law_info.get("phenomena", "")
-                }
-            elif V and R:
-                current = V / R
-                power = V**2 / R
-                return {
-                    "result": {"current": current, "power": power},
-                    "units": {"current": "A (Amperes)", "power": "W (Watts)"},
-                    "formula": "I = V/R, P = V²/R",
-                    "explanation": f"I = {V}V / {R}Ω = {current}A, P = ({V}V)² / {R}Ω = {power}W"
-                }
-            elif I and R:
-                voltage = I * R
-                power = I**2 * R
-                return {
-                    "result": {"voltage": voltage, "power": power},
-                    "units": {"voltage": "V (Volts)", "power": "W (Watts)"},
-                    "formula": "V = IR, P = I²R",
-                    "explanation": f"V = {I}A × {R}Ω = {voltage}V, P = ({I}A)² × {R}Ω = {power}W"
-                }
-            else:
-                return {"error": "Need at least 2 of: voltage (V), current (I), resistance (R)"}
-        
-        elif law == "coulombs_law":
-            # F = k(q₁q₂)/r²
-            k = kwargs.get('k', 8.99e9)  # Coulomb's constant
-            q1 = kwargs.get('charge1', kwargs.get('q1'))
-            q2 = kwargs.get('charge2', kwargs.get('q2'))
-            r = kwargs.get('distance', kwargs.get('r'))
-            
-            if q1 is None or q2 is None or r is None:
-                return {"error": "Missing required parameters: charge1 (C), charge2 (C), distance (m)"}
-            
-            force = k * abs(q1 * q2) / (r**2)
-            print(f"Applying Coulomb's Law: F = k|q₁q₂|/r² = {k} × |{q1} × {q2}| / {r}² = {force}")
-            return {
-                "result": force,
-                "units": "N (Newtons)",
-                "formula": law_info.get("formula", "F = k|q₁q₂|/r²"),
-                "explanation": f"Force = {k} × |{q1} × {q2}| C² / ({r} m)² = {force} N",
-                "law_summary": law_info.get("summary", ""),
-                "phenomena": law_info.get("phenomena", "")
-            }
-        
-        # THERMODYNAMICS
-        elif law == "ideal_gas_law":
-            # PV = nRT
-            P = kwargs.get('pressure', kwargs.get('P'))
-            V = kwargs.get('volume', kwargs.get('V'))
-            n = kwargs.get('moles', kwargs.get('n'))
-            R = kwargs.get('R', 8.314)  # Gas constant
-            T = kwargs.get('temperature', kwargs.get('T'))
-            
-            known_vars = sum([x is not None for x in [P, V, n, T]])
-            if known_vars < 3:
-                return {"error": "Need at least 3 of: pressure (Pa), volume (m³), moles (mol), temperature (K)"}
-            
-            if P is None:
-                pressure = (n * R * T) / V
-                return {
-                    "result": pressure,
-                    "units": "Pa (Pascals)",
-                    "formula": "P = nRT/V",
-                    "explanation": f"Pressure = {n} mol × {R} J/(mol⋅K) × {T} K / {V} m³ = {pressure} Pa"
-                }
-            elif V is None:
-                volume = (n * R * T) / P
-                return {
-                    "result": volume,
-                    "units": "m³",
-                    "formula": "V = nRT/P",
-                    "explanation": f"Volume = {n} mol × {R} J/(mol⋅K) × {T} K / {P} Pa = {volume} m³"
-                }
-            elif T is None:
-                temperature = (P * V) / (n * R)
-                return {
-                    "result": temperature,
-                    "units": "K (Kelvin)",
-                    "formula": "T = PV/(nR)",
-                    "explanation": f"Temperature = {P} Pa × {V} m³ / ({n} mol × {R} J/(mol⋅K)) = {temperature} K"
-                }
-            elif n is None:
-                moles = (P * V) / (R * T)
-                return {
-                    "result": moles,
-                    "units": "mol",
-                    "formula": "n = PV/(RT)",
-                    "explanation": f"Moles = {P} Pa × {V} m³ / ({R} J/(mol⋅K) × {T} K) = {moles} mol"
-                }
-        
-        # OPTICS
-        elif law == "snells_law":
-            # n₁sin(θ₁) = n₂sin(θ₂)
-            n1 = kwargs.get('n1', kwargs.get('index1'))
-            n2 = kwargs.get('n2', kwargs.get('index2'))
-            theta1 = kwargs.get('theta1', kwargs.get('angle1'))
-            theta2 = kwargs.get('theta2', kwargs.get('angle2'))
-            
-            if n1 and n2 and theta1:
-                theta1_rad = math.radians(theta1)
-                sin_theta2 = (n1 * math.sin(theta1_rad)) / n2
-                if abs(sin_theta2) > 1:
-                    return {"error": "Total internal reflection occurs - no refracted ray"}
-                theta2_rad = math.asin(sin_theta2)
-                theta2_deg = math.degrees(theta2_rad)
-                return {
-                    "result": theta2_deg,
-                    "units": "degrees",
-                    "formula": law_info.get("formula", "n₁sin(θ₁) = n₂sin(θ₂)"),
-                    "explanation": f"θ₂ = arcsin({n1}×sin({theta1}°)/{n2}) = {theta2_deg:.2f}°",
-                    "law_summary": law_info.get("summary", ""),
-                    "phenomena": law_info.get("phenomena", "")
-                }
-            else:
-                return {"error": "Need refractive indices n1, n2 and incident angle theta1"}
-        
-        else:
-            available_laws = list(PHYSICS_LAWS.keys())
-            return {
-                "error": f"Unknown law '{law}'. Available laws: {', '.join(available_laws)}",
-                "available_laws": {name: info["summary"] for name, info in PHYSICS_LAWS.items()}
-            }
-    
-    except Exception as e:
-        print(f"Error in physics calculation: {e}")
-        return {"error": f"Calculation error: {str(e)}"}
+        return handler(kwargs, include_explanation)
+    except TypeError as e:
+        _log.debug("Invalid parameters for %s: %s", law, e)
+        return {"error": f"Calculation error: parameters must be numbers ({e})"}
+    except (ValueError, ArithmeticError) as e:
+        _log.debug("Calculation failed for %s: %s", law, e)
+        return {"error": f"Calculation error: {e}"}
 
 
 _physics_agent = Agent(
@@ -713,15 +768,18 @@ _physics_agent = Agent(
     - ideal_gas_law: pressure, volume, moles, temperature (need 3 of 4)
     - snells_law: n1, n2, theta1
     
+    Pass include_explanation=False to physics_calc() when only the numeric result is needed.
+    
     Constants lookup usage:
     - physics_constants_lookup() - Overview of all categories
     - physics_constants_lookup(category="fundamental") - List constants by category
     - physics_constants_lookup(constant_name="speed_of_light") - Get specific constant
+    - physics_constants_lookup_batch(constant_names=["speed_of_light", "planck_constant"]) - Get several constants in one call
     
     Always include proper units and explain the physical significance of the result.
     When a calculation requires a physical constant, look it up first and then use it in the calculation.
     """,
-    tools=[physics_calc, physics_constants_lookup],
+    tools=[physics_calc, physics_constants_lookup, physics_constants_lookup_batch],
 )
 
 physics_calculator_agent = AgentTool(agent=_physics_agent)
\ No newline at end of file
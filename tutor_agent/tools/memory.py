@@ -28,16 +28,26 @@ Example Use Cases:
     - Providing personalized practice
 """
 
+import copy
 from datetime import datetime
-import json
+import functools
+import logging
+import mmap
 import os
+from statistics import fmean, linear_regression
+import sys
 from typing import Dict, Any
 
+import fastjsonschema
+import orjson
+import xxhash
+
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.sessions.state import State
 from google.adk.tools import ToolContext
 from google.adk.agents import Agent
-from tutor_agent.profile import TUTOR_PROFILE
+
+_log = logging.getLogger(__name__)
 
 # Constants for state management
 SYSTEM_TIME = "_time"
@@ -48,39 +58,64 @@ SESSION_START_TIME = "session_start_time"
 SESSION_END_TIME = "session_end_time"
 START_TIME = "start_time"
 END_TIME = "end_time"
+QA_CACHE_KEY = "__qa_cache__"
 
 SAMPLE_SCENARIO_PATH = os.getenv(
-    "TUTOR_AGENT_SCENARIO", "tutor_agent/profiles/tutor_default.json"
+    "TUTOR_AGENT_SCENARIO",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "profiles", "tutor_default.json",
+    ),
 )
 
-# Initialize the memory agent
-memory_agent = Agent(
-    model="gemini-2.0-flash",
-    name="memory_agent",
-    description="""
-    A specialized memory agent that maintains learning progress and
-    session history for personalized tutoring.
-    
-    The agent manages:
-    - Learning session context
-    - Concept mastery tracking
-    - Student progress history
-    - Personalized recommendations
-    - Learning path optimization
-    
-    This helps create a continuous and adaptive
-    learning experience for each student.
-    """,
-    instruction=f"""
-    You are a memory agent that maintains learning progress and session history.
-    Use the following profile to guide your interactions:
-    
-    {TUTOR_PROFILE}
-    
-    Always consider the student's learning history and progress
-    when providing assistance or recommendations.
-    """,
-)
+# Shape of a scenario file, checked once when it is loaded so that a missing
+# field fails with its path instead of a KeyError while setting up a session
+_validate_scenario = fastjsonschema.compile({
+    "type": "object",
+    "required": ["state"],
+    "properties": {
+        "state": {
+            "type": "object",
+            "properties": {
+                SESSION_KEY: {
+                    "if": {"minProperties": 1},
+                    "then": {"required": [START_TIME, END_TIME]},
+                },
+            },
+        },
+    },
+})
+
+# Most values kept in one memorized list; the oldest are dropped beyond this
+MAX_LIST_LEN = int(os.getenv("TUTOR_MAX_LIST", "1000"))
+
+def _ordered_set(mem_dict: State | dict[str, Any], key: str) -> dict | None:
+    """
+    Return a copy of the list memorized at key, empty if there is none.
+
+    Memorized lists are stored as dicts whose keys are the values in the order
+    they were memorized, so adding, finding and removing a value take constant
+    time and the state stays JSON serializable. A list stored at key, such as
+    one from the initial scenario, is converted.
+
+    ADK only persists state changes made by assigning to a key, so callers
+    change the copy and assign it back rather than modifying the stored value.
+
+    Returns:
+        The copy, or None if key holds something other than a list, such as
+        a string stored by memorize.
+    """
+    stored = mem_dict.get(key)
+    if stored is None:
+        return {}
+    if isinstance(stored, dict):
+        # Only dicts built here map every value to None; any other dict
+        # holds data of its own that must not be dropped
+        return dict(stored) if all(v is None for v in stored.values()) else None
+    if isinstance(stored, list):
+        return dict.fromkeys(stored)
+    return None
+
 
 def memorize_list(key: str, value: str, tool_context: ToolContext):
     """
@@ -94,11 +129,17 @@ def memorize_list(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    mem_dict = tool_context.state
-    if key not in mem_dict:
-        mem_dict[key] = []
-    if value not in mem_dict[key]:
-        mem_dict[key].append(value)
+    # Concept names recur across sessions; interned, they share one object
+    if isinstance(value, str):
+        value = sys.intern(value)
+    # Setting a value that is already memorized keeps its original position
+    items = _ordered_set(tool_context.state, key)
+    if items is None:
+        return {"error": f'"{key}" does not hold a list'}
+    items[value] = None
+    while len(items) > MAX_LIST_LEN:
+        del items[next(iter(items))]
+    tool_context.state[key] = items
     return {"status": f'Stored "{key}": "{value}"'}
 
 
@@ -115,10 +156,28 @@ def memorize(key: str, value: str, tool_context: ToolContext):
         A status message.
     """
     mem_dict = tool_context.state
-    mem_dict[key] = value
+    mem_dict[key] = sys.intern(value) if isinstance(value, str) else value
     return {"status": f'Stored "{key}": "{value}"'}
 
 
+def memorize_many(keys: list[str], values: list[str], tool_context: ToolContext):
+    """
+    Memorize several key-value pairs in a single state update.
+
+    Args:
+        keys: the labels indexing the memories.
+        values: the information to be stored, in the same order as keys.
+        tool_context: The ADK tool context.
+
+    Returns:
+        A status message.
+    """
+    if len(keys) != len(values):
+        return {"error": f"Got {len(keys)} keys for {len(values)} values"}
+    tool_context.state.update(dict(zip(keys, values)))
+    return {"status": f"Stored {len(keys)} keys"}
+
+
 def forget(key: str, value: str, tool_context: ToolContext):
     """
     Forget pieces of information.
@@ -131,13 +190,181 @@ def forget(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    if tool_context.state[key] is None:
-        tool_context.state[key] = []
-    if value in tool_context.state[key]:
-        tool_context.state[key].remove(value)
+    items = _ordered_set(tool_context.state, key)
+    if items is None:
+        return {"error": f'"{key}" does not hold a list'}
+    if value in items:
+        del items[value]
+        tool_context.state[key] = items
     return {"status": f'Removed "{key}": "{value}"'}
 
 
+def _question_key(question: str) -> str:
+    """Return the answer cache key of a question, ignoring case and surrounding whitespace."""
+    return xxhash.xxh3_64_hexdigest(question.strip().lower())
+
+
+def memo_get(question: str, tool_context: ToolContext):
+    """
+    Recall the answer stored for a question asked earlier in the session.
+
+    Args:
+        question: the student's question.
+        tool_context: The ADK tool context.
+
+    Returns:
+        The stored answer, or a status message if there is none.
+    """
+    cache = tool_context.state.get(QA_CACHE_KEY)
+    answer = cache.get(_question_key(question)) if cache else None
+    if answer is None:
+        return {"status": "No stored answer for this question"}
+    return {"answer": answer}
+
+
+def memo_put(question: str, answer: str, tool_context: ToolContext):
+    """
+    Store the answer to a question so it can be recalled if asked again.
+
+    Args:
+        question: the student's question.
+        answer: the answer given.
+        tool_context: The ADK tool context.
+
+    Returns:
+        A status message.
+    """
+    # ADK only persists assignments to state, so store an updated copy
+    cache = tool_context.state.get(QA_CACHE_KEY) or {}
+    tool_context.state[QA_CACHE_KEY] = {**cache, _question_key(question): answer}
+    return {"status": "Stored answer"}
+
+
+def memo_clear(tool_context: ToolContext):
+    """
+    Forget all stored answers, e.g. after the student's material has changed.
+
+    Args:
+        tool_context: The ADK tool context.
+
+    Returns:
+        A status message.
+    """
+    tool_context.state[QA_CACHE_KEY] = {}
+    return {"status": "Cleared stored answers"}
+
+
+def record_score(key: str, score: float, tool_context: ToolContext):
+    """
+    Record a score for a concept, keeping the scores in the order they were earned.
+
+    Args:
+        key: the label indexing the scores, e.g. "kinetic_energy_scores".
+        score: the score to record.
+        tool_context: The ADK tool context.
+
+    Returns:
+        A status message.
+    """
+    scores = tool_context.state.get(key)
+    if scores is None:
+        scores = []
+    elif not isinstance(scores, list):
+        return {"error": f'"{key}" does not hold a list of scores'}
+    # ADK only persists assignments to state, so store an updated copy
+    tool_context.state[key] = [*scores, float(score)][-MAX_LIST_LEN:]
+    return {"status": f'Recorded score {score} for "{key}"'}
+
+
+def concept_stats(key: str, tool_context: ToolContext):
+    """
+    Summarize the scores recorded for a concept.
+
+    Args:
+        key: the label indexing the scores.
+        tool_context: The ADK tool context.
+
+    Returns:
+        The mean score, the number of scores, and the trend: the change in
+        score per attempt along a least-squares line, 0.0 for a single score.
+    """
+    try:
+        scores = [float(score) for score in tool_context.state.get(key) or ()]
+    except (TypeError, ValueError):
+        return {"error": f'"{key}" does not hold numeric scores'}
+    if not scores:
+        return {"error": f'No scores recorded for "{key}"'}
+    trend = linear_regression(range(len(scores)), scores).slope if len(scores) > 1 else 0.0
+    return {"mean": fmean(scores), "n": len(scores), "trend": trend}
+
+
+def _tutor_profile() -> str:
+    """
+    Return the student profile of the scenario, serialized for the memory
+    agent's instruction. It is the scenario's user_profile entry if it has
+    one, otherwise its whole initial state.
+    """
+    state = _load_scenario(SAMPLE_SCENARIO_PATH)["state"]
+    profile = state.get(PROFILE_KEY, state)
+    if isinstance(profile, str):
+        return profile
+    return orjson.dumps(profile, option=orjson.OPT_INDENT_2).decode()
+
+
+@functools.lru_cache(maxsize=1)
+def get_memory_agent() -> Agent:
+    """Build the memory agent on first use."""
+    return Agent(
+        model="gemini-2.0-flash",
+        name="memory_agent",
+        description="""
+        A specialized memory agent that maintains learning progress and
+        session history for personalized tutoring.
+    
+        The agent manages:
+        - Learning session context
+        - Concept mastery tracking
+        - Student progress history
+        - Personalized recommendations
+        - Learning path optimization
+    
+        This helps create a continuous and adaptive
+        learning experience for each student.
+        """,
+        instruction=f"""
+        You are a memory agent that maintains learning progress and session history.
+        Use the following profile to guide your interactions:
+    
+        {_tutor_profile()}
+    
+        Always consider the student's learning history and progress
+        when providing assistance or recommendations.
+    
+        When storing several memories at once, use memorize_many in a single
+        call instead of calling memorize for each one.
+    
+        Before answering a question, check memo_get for an answer stored earlier
+        in the session, and store new answers with memo_put. Use memo_clear when
+        stored answers should no longer be reused.
+    
+        Record the student's scores per concept with record_score, and use
+        concept_stats to see their average and whether they are improving.
+        """,
+        tools=[
+            memorize, memorize_list, memorize_many, forget,
+            memo_get, memo_put, memo_clear,
+            record_score, concept_stats,
+        ],
+    )
+
+
+def __getattr__(name):
+    # Keep `memory_agent` importable; it is built on first access
+    if name == "memory_agent":
+        return get_memory_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
     """
     Setting the initial session state given a JSON object of states.
@@ -147,17 +374,44 @@ def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
         target: The session state object to insert into.
     """
     if SYSTEM_TIME not in target:
-        target[SYSTEM_TIME] = str(datetime.now())
+        target[SYSTEM_TIME] = datetime.now().isoformat()
 
     if SESSION_INITIALIZED not in target:
-        target[SESSION_INITIALIZED] = True
-        target.update(source)
+        # Collect the initial state locally so the target gets a single update
+        initial = {SESSION_INITIALIZED: True, **source}
 
         session = source.get(SESSION_KEY, {})
         if session:
-            target[SESSION_START_TIME] = session[START_TIME]
-            target[SESSION_END_TIME] = session[END_TIME]
-            target[SESSION_START_TIME] = session[START_TIME]
+            initial[SESSION_START_TIME] = session[START_TIME]
+            initial[SESSION_END_TIME] = session[END_TIME]
+        target.update(initial)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_scenario(path: str) -> Dict[str, Any]:
+    """
+    Read and parse a scenario file. The file does not change while the
+    process runs, so it is only read on the first call for each path.
+
+    Args:
+        path: Path of the scenario JSON file.
+
+    Returns:
+        The parsed scenario. It is shared between calls and must not be modified.
+
+    Raises:
+        fastjsonschema.JsonSchemaException: If the scenario is missing a required field.
+    """
+    # Parse straight from the mapped file instead of first copying it into
+    # a bytes object
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+        scenario = orjson.loads(view)
+    _validate_scenario(scenario)
+    return scenario
 
 
 def _load_precreated_itinerary(callback_context: CallbackContext):
@@ -169,9 +423,12 @@ def _load_precreated_itinerary(callback_context: CallbackContext):
     Args:
         callback_context: The callback context.
     """    
-    data = {}
-    with open(SAMPLE_SCENARIO_PATH, "r") as file:
-        data = json.load(file)
-        print(f"\nLoading Initial State: {data}\n")
+    # Sessions are only initialized once; skip loading and copying the scenario
+    if SESSION_INITIALIZED in callback_context.state:
+        return
+
+    # Copy the cached scenario so that state updates never reach the cache
+    data = copy.deepcopy(_load_scenario(SAMPLE_SCENARIO_PATH))
+    _log.debug("Loading initial state: %s", data)
 
     _set_initial_states(data["state"], callback_context.state)